@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+OpenAPI to OpenClaw Skill Generator - Benchmarks
+=================================================
+Measures how the generator scales with spec size on synthetic specs, fully offline.
+
+Each scenario builds a spec with N operations, M shared schemas, a chain of D pure
+``$ref`` aliases and (optionally) reference cycles, then reports wall time and
+tracemalloc peak memory for every generation phase.
+
+Usage:
+    python bench_openapi_to_skill.py [--scenario small medium ...] [--repeat 3]
+    python bench_openapi_to_skill.py --operations 2000 --schemas 300 --ref-depth 15 --cycles
+    python bench_openapi_to_skill.py --baseline bench.json --update-baseline   # record
+    python bench_openapi_to_skill.py --baseline bench.json                     # compare
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import openapi_to_skill as gen  # noqa: E402
+
+# name: (operations, schemas, ref_depth, cycles)
+SCENARIOS: Dict[str, Tuple[int, int, int, bool]] = {
+    'small': (50, 20, 5, False),
+    'medium': (500, 200, 10, False),
+    'cyclic': (500, 200, 10, True),
+    'large': (5000, 1000, 20, True),
+}
+DEFAULT_SCENARIOS = ['small', 'medium', 'cyclic']
+
+# Nesting depth of the shared schemas (pure $ref chains are controlled by ref_depth)
+SCHEMA_CLUSTER = 4
+
+PHASES = ['parse', 'resolve_refs', 'examples', 'extract_operations', 'skill_md', 'client', 'write']
+
+# A phase regresses when it is this much slower/larger than the baseline...
+DEFAULT_THRESHOLD = 0.25
+# ...and the difference is above measurement noise
+MIN_SECONDS_DELTA = 0.005
+MIN_PEAK_MB_DELTA = 1.0
+
+
+def synthetic_spec(operations: int, schemas: int, ref_depth: int, cycles: bool) -> Dict[str, Any]:
+    """Build an OpenAPI 3 spec exercising refs, examples, pagination and tags."""
+    schemas = max(1, schemas)
+    components: Dict[str, Any] = {}
+    for i in range(schemas):
+        properties: Dict[str, Any] = {
+            'id': {'type': 'integer', 'format': 'int64'},
+            'name': {'type': 'string'},
+            'status': {'type': 'string', 'enum': ['active', 'archived']},
+            'created_at': {'type': 'string', 'format': 'date-time'},
+            'labels': {'type': 'array', 'items': {'type': 'string'}},
+        }
+        # Schemas nest in clusters of SCHEMA_CLUSTER; with cycles the last one points back
+        cluster_start = i - i % SCHEMA_CLUSTER
+        if i + 1 < min(cluster_start + SCHEMA_CLUSTER, schemas):
+            properties['child'] = {'$ref': f'#/components/schemas/Schema{i + 1}'}
+        elif cycles:
+            properties['child'] = {'$ref': f'#/components/schemas/Schema{cluster_start}'}
+        if cycles and i % 10 == 0:
+            properties['parent'] = {'$ref': f'#/components/schemas/Schema{i}'}
+        components[f'Schema{i}'] = {
+            'type': 'object',
+            'required': ['id', 'name'],
+            'properties': properties,
+        }
+    # Alias0 -> Alias1 -> ... -> Schema0: pure $ref chains
+    for d in range(ref_depth):
+        target = f'Alias{d + 1}' if d + 1 < ref_depth else 'Schema0'
+        components[f'Alias{d}'] = {'$ref': f'#/components/schemas/{target}'}
+
+    paths: Dict[str, Any] = {}
+    for i in range(operations):
+        schema_ref = {'$ref': f'#/components/schemas/Schema{i % schemas}'}
+        if ref_depth and i % 5 == 0:
+            schema_ref = {'$ref': '#/components/schemas/Alias0'}
+        collection = f'/group{i % 20}/resource{i // 2}'
+        method = 'get' if i % 2 == 0 else 'post'
+        operation: Dict[str, Any] = {
+            'operationId': f'{method}Resource{i}',
+            'tags': [f'group{i % 20}'],
+            'summary': f'{method.upper()} resource {i}',
+            'description': f'Operates on resource {i} of group {i % 20}.',
+            'responses': {
+                '200': {
+                    'description': 'OK',
+                    'content': {'application/json': {'schema': {
+                        'type': 'object',
+                        'properties': {
+                            'data': {'type': 'array', 'items': schema_ref},
+                            'next_cursor': {'type': 'string'},
+                        },
+                    }}},
+                },
+            },
+        }
+        if method == 'get':
+            operation['parameters'] = [
+                {'$ref': '#/components/parameters/Limit'},
+                {'name': 'cursor', 'in': 'query', 'schema': {'type': 'string'}},
+            ]
+        else:
+            operation['requestBody'] = {
+                'required': True,
+                'content': {'application/json': {'schema': schema_ref}},
+            }
+        paths.setdefault(collection, {})[method] = operation
+
+    return {
+        'openapi': '3.0.3',
+        'info': {'title': 'Synthetic Benchmark API', 'version': '1.0.0'},
+        'servers': [{'url': 'https://api.example.com/v1'}],
+        'paths': paths,
+        'components': {
+            'schemas': components,
+            'parameters': {
+                'Limit': {'name': 'limit', 'in': 'query', 'schema': {'type': 'integer', 'maximum': 100}},
+            },
+            'securitySchemes': {'bearer': {'type': 'http', 'scheme': 'bearer'}},
+        },
+    }
+
+
+def run_phases(
+    raw: bytes,
+    out_dir: Path,
+    state: Optional[Dict[str, Any]] = None
+) -> List[Tuple[str, Callable[[], Any]]]:
+    """The benchmark phases, in order; each closure feeds ``state`` to the next ones."""
+    state = {} if state is None else state
+
+    def parse():
+        state['spec'], _ = gen.parse_spec_content(raw, 'json')
+
+    def resolve_refs():
+        gen.release_spec(state['spec'])
+        resolver = gen.get_resolver(state['spec'])
+        for ref in gen.iter_refs(state['spec']):
+            resolver.resolve(ref)
+
+    def examples():
+        # A fresh builder on the warm resolver: only example generation is timed
+        builder = gen.SchemaExampleBuilder(gen.get_resolver(state['spec']))
+        for schema in state['spec']['components']['schemas'].values():
+            builder.example(schema)
+
+    def extract_operations():
+        gen.release_spec(state['spec'])
+        state['operations'] = gen.extract_operations(state['spec'], 'openapi3')
+
+    def skill_md():
+        spec = state['spec']
+        state['skill_md'] = gen.generate_skill_md(
+            spec, 'openapi3', state['operations'], 'synthetic', gen.extract_base_url(spec, 'openapi3'),
+            gen.extract_security_schemes(spec, 'openapi3'))
+
+    def client():
+        spec = state['spec']
+        state['client'] = gen.generate_api_client(
+            spec, 'openapi3', state['operations'], 'synthetic', gen.extract_base_url(spec, 'openapi3'),
+            gen.extract_security_schemes(spec, 'openapi3'))
+        state['shards'] = gen.generate_operation_shards(state['operations'])
+        state['search_index'] = gen.generate_search_index(state['operations'])
+
+    def write():
+        files = {
+            'SKILL.md': state['skill_md'],
+            'scripts/api_client.py': state['client'],
+            'scripts/search_index.json': state['search_index'],
+            **{f'scripts/operations/{name}': content for name, content in state['shards'].items()},
+        }
+        (out_dir / 'scripts' / 'operations').mkdir(parents=True, exist_ok=True)
+        for rel_path, content in files.items():
+            gen._write_if_changed(out_dir, rel_path, content, {}, {})
+
+    phases = [parse, resolve_refs, examples, extract_operations, skill_md, client, write]
+    return [(phase.__name__, phase) for phase in phases]
+
+
+def _quiet(func: Callable[[], Any]) -> None:
+    """Run a phase with the generator's progress prints discarded."""
+    stdout, sys.stdout = sys.stdout, open(os.devnull, 'w')
+    try:
+        func()
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+
+def benchmark(raw: bytes, repeat: int) -> Dict[str, Dict[str, float]]:
+    """Best-of-``repeat`` seconds per phase, then one tracemalloc pass for peak memory."""
+    results = {name: {'seconds': float('inf'), 'peak_mb': 0.0} for name in PHASES}
+    with tempfile.TemporaryDirectory() as tmp:
+        for _ in range(repeat):
+            state: Dict[str, Any] = {}
+            for name, phase in run_phases(raw, Path(tmp), state):
+                gc.collect()
+                started = time.perf_counter()
+                _quiet(phase)
+                results[name]['seconds'] = min(results[name]['seconds'], time.perf_counter() - started)
+            gen.release_spec(state['spec'])
+
+        # Tracing slows allocation-heavy code down, so memory gets its own pass
+        tracemalloc.start()
+        state = {}
+        try:
+            for name, phase in run_phases(raw, Path(tmp), state):
+                gc.collect()
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+                _quiet(phase)
+                results[name]['peak_mb'] = (tracemalloc.get_traced_memory()[1] - baseline) / 1_048_576
+        finally:
+            tracemalloc.stop()
+            if 'spec' in state:
+                gen.release_spec(state['spec'])
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, Dict[str, float]]],
+    baseline: Dict[str, Any],
+    threshold: float
+) -> List[str]:
+    """Describe every phase that regressed against ``baseline``."""
+    regressions = []
+    for scenario, phases in results.items():
+        for phase, current in phases.items():
+            previous = baseline.get('scenarios', {}).get(scenario, {}).get(phase)
+            if not previous:
+                continue
+            for metric, noise in (('seconds', MIN_SECONDS_DELTA), ('peak_mb', MIN_PEAK_MB_DELTA)):
+                before, after = previous[metric], current[metric]
+                if after > before * (1 + threshold) and after - before > noise:
+                    regressions.append(f"{scenario}/{phase}: {metric} {before:.3f} -> {after:.3f} "
+                                       f"(+{(after / before - 1) * 100 if before else float('inf'):.0f}%)")
+    return regressions
+
+
+def print_results(
+    scenario: str,
+    shape: Tuple[int, int, int, bool],
+    results: Dict[str, Dict[str, float]],
+    previous: Optional[Dict[str, Dict[str, float]]]
+) -> None:
+    operations, schemas, ref_depth, cycles = shape
+    print(f"\n📊 {scenario}: {operations} operations, {schemas} schemas, "
+          f"$ref depth {ref_depth}{', cycles' if cycles else ''}")
+    print(f"   {'PHASE':<20} {'TIME':>10} {'PEAK':>10}  {'VS BASELINE':>11}")
+    for phase in PHASES:
+        current = results[phase]
+        delta = ''
+        if previous and phase in previous and previous[phase]['seconds']:
+            delta = f"{(current['seconds'] / previous[phase]['seconds'] - 1) * 100:+.0f}%"
+        print(f"   {phase:<20} {current['seconds'] * 1000:>8.1f}ms {current['peak_mb']:>8.1f}MB  {delta:>11}")
+    total = sum(r['seconds'] for r in results.values())
+    print(f"   {'total':<20} {total * 1000:>8.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the OpenAPI skill generator on synthetic specs",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="Scenarios (operations, schemas, ref depth, cycles): "
+               + ', '.join(f"{name}={shape}" for name, shape in SCENARIOS.items())
+    )
+    parser.add_argument("--scenario", "-s", nargs="+", choices=list(SCENARIOS),
+                        help=f"Preset scenarios to run (default: {' '.join(DEFAULT_SCENARIOS)})")
+    parser.add_argument("--operations", type=int, help="Run a custom scenario with this many operations")
+    parser.add_argument("--schemas", type=int, default=100, help="Shared schemas in the custom scenario")
+    parser.add_argument("--ref-depth", type=int, default=10, help="$ref alias chain length in the custom scenario")
+    parser.add_argument("--cycles", action="store_true", help="Add reference cycles to the custom scenario")
+    parser.add_argument("--repeat", "-r", type=int, default=3, help="Timing runs per scenario (best is kept)")
+    parser.add_argument("--baseline", "-b", help="Baseline JSON file to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results to --baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Relative slowdown reported as a regression (default: {DEFAULT_THRESHOLD})")
+
+    args = parser.parse_args()
+
+    scenarios = {name: SCENARIOS[name] for name in (args.scenario or [])}
+    if args.operations:
+        custom = (args.operations, args.schemas, args.ref_depth, args.cycles)
+        scenarios[f"custom-{args.operations}-{args.schemas}-{args.ref_depth}{'-cyclic' if args.cycles else ''}"] = custom
+    if not scenarios:
+        scenarios = {name: SCENARIOS[name] for name in DEFAULT_SCENARIOS}
+
+    baseline: Dict[str, Any] = {}
+    if args.baseline and Path(args.baseline).exists():
+        baseline = json.loads(Path(args.baseline).read_text())
+
+    print(f"⚙️  Parsers: JSON={gen.json_parser_name()}, YAML={gen.yaml_parser_name()}; "
+          f"generator {gen.GENERATOR_VERSION}; best of {args.repeat}")
+    all_results = {}
+    for scenario, shape in scenarios.items():
+        raw = json.dumps(synthetic_spec(*shape)).encode('utf-8')
+        all_results[scenario] = benchmark(raw, max(1, args.repeat))
+        print_results(scenario, shape, all_results[scenario], baseline.get('scenarios', {}).get(scenario))
+
+    if args.update_baseline:
+        if not args.baseline:
+            parser.error("--update-baseline needs --baseline FILE")
+        merged = {**baseline.get('scenarios', {}), **all_results}
+        Path(args.baseline).write_text(json.dumps({
+            'generator_version': gen.GENERATOR_VERSION,
+            'python': sys.version.split()[0],
+            'scenarios': merged,
+        }, indent=2))
+        print(f"\n💾 Baseline written to {args.baseline}")
+        return
+
+    if baseline:
+        regressions = compare(all_results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) against {args.baseline}:", file=sys.stderr)
+            for regression in regressions:
+                print(f"   {regression}", file=sys.stderr)
+            sys.exit(1)
+        print(f"\n✅ No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
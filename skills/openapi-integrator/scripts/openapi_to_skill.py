@@ -5,7 +5,8 @@ OpenAPI to OpenClaw Skill Generator
 Converts OpenAPI 3.x / Swagger 2.x specifications into ready-to-use OpenClaw skill folders.
 
 Usage:
-    python openapi_to_skill.py <spec_url_or_path> [--output <dir>] [--name <skill-name>]
+    python openapi_to_skill.py <spec_url_or_path> [--output <dir>] [--name <skill-name>] [--split]
+    python openapi_to_skill.py --batch <manifest> [--output <dir>] [--jobs N]
 
 Examples:
     python openapi_to_skill.py https://petstore3.swagger.io/api/v3/openapi.json
@@ -13,20 +14,56 @@ Examples:
 """
 
 import argparse
+import contextlib
+import hashlib
+import io
 import json
 import os
+import pickle
 import re
+import shutil
 import sys
+import tempfile
+import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
 
 # Try to import yaml, fall back gracefully
 try:
     import yaml
     HAS_YAML = True
+    # libyaml-backed loader is an order of magnitude faster on large specs
+    YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 except ImportError:
     HAS_YAML = False
+    YAML_LOADER = None
+
+# Try to import a C-accelerated JSON parser, fall back to stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+JSON_DECODE_ERRORS: Tuple[type, ...] = (ValueError,)
+if HAS_MSGSPEC:
+    JSON_DECODE_ERRORS += (msgspec.DecodeError,)
+
+# Try to import ijson for streaming very large JSON specs
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
 
 # Try to import httpx for URL fetching
 try:
@@ -35,47 +72,436 @@ try:
 except ImportError:
     HAS_HTTPX = False
 
+# Bump when generated output changes so cached skill folders are regenerated
+GENERATOR_VERSION = "1.9.0"
 
-def fetch_spec(source: str) -> Tuple[Dict[str, Any], str]:
-    """Fetch OpenAPI spec from URL or file path. Returns (spec_dict, format)."""
+# Parsed specs are cached here between runs (override with OPENAPI_SKILL_CACHE)
+DEFAULT_CACHE_DIR = Path(os.environ.get(
+    'OPENAPI_SKILL_CACHE', Path.home() / '.cache' / 'openapi-integrator'
+))
+
+# Concurrent downloads of documents referenced by external $refs
+REF_FETCH_CONCURRENCY = 8
+
+# Concurrent downloads in --batch mode (parsing and generation use one process per core)
+BATCH_FETCH_CONCURRENCY = 8
+
+# JSON specs larger than this are parsed in streaming mode when ijson is installed
+STREAM_THRESHOLD_BYTES = 100 * 1024 * 1024
+
+# Written into every generated skill folder to record what it was built from
+STAMP_FILE = '.openapi-skill.json'
+
+# Target size of each generated operations/<shard>.json file read by api_client.py
+OPERATIONS_PER_SHARD = 64
+
+
+def read_spec_source(
+    source: str,
+    validators: Optional[Dict[str, str]] = None
+) -> Tuple[Optional[bytes], Optional[str], Dict[str, str]]:
+    """Read raw spec bytes from URL or file path.
+    
+    Returns (content, extension_hint, validators). For URLs, ``validators`` carries the
+    ETag/Last-Modified of a cached copy; content is None when the server answers 304.
+    """
+    validators = validators or {}
     
     # Check if it's a URL
     if source.startswith(('http://', 'https://')):
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        
         if not HAS_HTTPX:
             # Fallback to urllib
+            import urllib.error
             import urllib.request
-            with urllib.request.urlopen(source) as response:
-                content = response.read().decode('utf-8')
+            request = urllib.request.Request(source, headers=headers)
+            try:
+                with urllib.request.urlopen(request) as response:
+                    content = response.read()
+                    resp_headers = response.headers
+            except urllib.error.HTTPError as e:
+                if e.code != 304:
+                    raise
+                content, resp_headers = None, e.headers
         else:
-            response = httpx.get(source, follow_redirects=True, timeout=30)
-            response.raise_for_status()
-            content = response.text
+            response = httpx.get(source, headers=headers, follow_redirects=True, timeout=30)
+            if response.status_code == 304:
+                content = None
+            else:
+                response.raise_for_status()
+                content = response.content
+            resp_headers = response.headers
         
-        # Detect format
-        if source.endswith('.yaml') or source.endswith('.yml'):
-            fmt = 'yaml'
-        else:
-            fmt = 'json'
+        new_validators = {
+            'etag': resp_headers.get('ETag', '') or validators.get('etag', ''),
+            'last_modified': resp_headers.get('Last-Modified', '') or validators.get('last_modified', ''),
+        }
+        suffix = Path(urlparse(source).path).suffix
     else:
         # It's a file path
         path = Path(source)
         if not path.exists():
             raise FileNotFoundError(f"Spec file not found: {source}")
         
-        content = path.read_text()
-        fmt = 'yaml' if path.suffix in ('.yaml', '.yml') else 'json'
+        content = path.read_bytes()
+        new_validators = {}
+        suffix = path.suffix
+    
+    return content, _suffix_hint(suffix), new_validators
+
+
+def _suffix_hint(suffix: str) -> Optional[str]:
+    """Format suggested by a file extension, if any."""
+    if suffix in ('.yaml', '.yml'):
+        return 'yaml'
+    if suffix == '.json':
+        return 'json'
+    return None
+
+
+def _temp_path(dest: Path, suffix: str = '.tmp') -> Path:
+    """A new, uniquely named temporary file next to ``dest`` (concurrent writers never share one)."""
+    fd, name = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.", suffix=suffix)
+    os.close(fd)
+    return Path(name)
+
+
+def download_spec(source: str, dest: Path, validators: Optional[Dict[str, str]] = None) -> Tuple[bool, Dict[str, str]]:
+    """Stream a remote spec into ``dest`` without holding it in memory.
+    
+    ``validators`` (ETag/Last-Modified of the copy already at ``dest``) make the request
+    conditional. Returns (modified, new_validators); ``dest`` is untouched on 304.
+    """
+    validators = validators or {}
+    headers = {}
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _temp_path(dest, '.part')
+    try:
+        if HAS_HTTPX:
+            with httpx.stream('GET', source, headers=headers, follow_redirects=True, timeout=30) as response:
+                if response.status_code == 304:
+                    return False, validators
+                response.raise_for_status()
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_bytes(1 << 20):
+                        f.write(chunk)
+                resp_headers = response.headers
+        else:
+            import urllib.error
+            import urllib.request
+            try:
+                with urllib.request.urlopen(urllib.request.Request(source, headers=headers)) as response:
+                    with open(tmp_path, 'wb') as f:
+                        shutil.copyfileobj(response, f, 1 << 20)
+                    resp_headers = response.headers
+            except urllib.error.HTTPError as e:
+                if e.code != 304:
+                    raise
+                return False, validators
+        os.replace(tmp_path, dest)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    
+    return True, {
+        'etag': resp_headers.get('ETag', ''),
+        'last_modified': resp_headers.get('Last-Modified', ''),
+    }
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class StreamedPaths:
+    """Read-only stand-in for a JSON spec's ``paths`` mapping that parses one path item at a time.
+    
+    Used in streaming mode so the largest section of a huge spec is never held in memory.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = path
     
-    # Parse
+    def items(self):
+        with open(self.path, 'rb') as f:
+            yield from ijson.kvitems(f, 'paths', use_float=True)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return next((item for name, item in self.items() if name == key), default)
+
+
+def load_streaming_spec(path: Path) -> Dict[str, Any]:
+    """Parse every top-level section of a JSON spec except ``paths``, which is streamed.
+    
+    One ijson event pass builds ``info``, ``components``, ``servers`` and friends while
+    skipping ``paths``; extract_operations() later walks it through StreamedPaths.
+    """
+    started = time.perf_counter()
+    spec: Dict[str, Any] = {}
+    key: Optional[str] = None
+    builder = None
+    with open(path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == '':
+                # Root-level events delimit the top-level sections
+                if builder is not None:
+                    spec[key] = builder.value
+                    builder = None
+                if event == 'map_key':
+                    key = value
+                    if value == 'paths':
+                        spec['paths'] = StreamedPaths(path)
+                    else:
+                        builder = ijson.ObjectBuilder()
+                continue
+            if builder is not None:
+                builder.event(event, value)
+    print(f"⏱️  Streamed {path.stat().st_size / 1_048_576:.1f} MB spec skeleton in "
+          f"{time.perf_counter() - started:.2f}s (ijson {ijson.backend})")
+    return spec
+
+
+def detect_spec_format(content: bytes, hint: Optional[str] = None) -> str:
+    """Detect 'json' or 'yaml' from the document content, using the extension only as a tie-breaker."""
+    head = content[:64].lstrip(b'\xef\xbb\xbf \t\r\n')
+    if head.startswith((b'{', b'[')):
+        return 'json'
+    if head:
+        return 'yaml'
+    return hint or 'json'
+
+
+def json_parser_name() -> str:
+    """Name of the fastest available JSON parser."""
+    if HAS_ORJSON:
+        return 'orjson'
+    if HAS_MSGSPEC:
+        return 'msgspec'
+    return 'json'
+
+
+def yaml_parser_name() -> str:
+    """Name of the YAML loader in use."""
+    if not HAS_YAML:
+        return 'none'
+    return 'libyaml' if YAML_LOADER is not yaml.SafeLoader else 'pyyaml'
+
+
+def parse_spec(content: bytes, fmt: str) -> Any:
+    """Parse spec bytes with the fastest available parser for the format."""
     if fmt == 'yaml':
         if not HAS_YAML:
             raise ImportError("PyYAML required for YAML specs. Install with: pip install pyyaml")
-        spec = yaml.safe_load(content)
-    else:
-        spec = json.loads(content)
+        return yaml.load(content, Loader=YAML_LOADER)
+    
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    if HAS_MSGSPEC:
+        return msgspec.json.decode(content)
+    return json.loads(content)
+
+
+def parse_spec_content(content: bytes, hint: Optional[str] = None, quiet: bool = False) -> Tuple[Dict[str, Any], str]:
+    """Detect the format of raw spec bytes and parse them. Returns (spec_dict, format)."""
+    fmt = detect_spec_format(content, hint)
+    
+    started = time.perf_counter()
+    try:
+        spec = parse_spec(content, fmt)
+    except JSON_DECODE_ERRORS:
+        # Content sniffing said JSON but the document is not; JSON is a subset of YAML
+        if fmt != 'json' or not HAS_YAML:
+            raise
+        fmt = 'yaml'
+        spec = parse_spec(content, fmt)
+    elapsed = time.perf_counter() - started
+    
+    parser = yaml_parser_name() if fmt == 'yaml' else json_parser_name()
+    if not quiet:
+        print(f"⏱️  Parsed {len(content) / 1_048_576:.1f} MB of {fmt} in {elapsed:.2f}s ({parser})")
+    
+    if not isinstance(spec, dict):
+        raise ValueError(f"Spec must be a mapping at the top level, got {type(spec).__name__}")
     
     return spec, fmt
 
 
+def _canonical_source(source: str) -> str:
+    """Cache identity of a spec source: the URL itself or the absolute file path."""
+    if source.startswith(('http://', 'https://')):
+        return source
+    return str(Path(source).resolve())
+
+
+def _cache_paths(cache_dir: Path, source: str) -> Tuple[Path, Path, Path]:
+    """Metadata, pickle and raw-document paths for a cached spec source."""
+    key = hashlib.sha256(_canonical_source(source).encode('utf-8')).hexdigest()[:32]
+    return cache_dir / f"{key}.json", cache_dir / f"{key}.pickle", cache_dir / f"{key}.src"
+
+
+def _load_cached_spec(pickle_path: Path) -> Optional[Dict[str, Any]]:
+    """Load a pickled spec, treating any unreadable cache entry as a miss."""
+    try:
+        with open(pickle_path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+
+
+def read_cache_meta(source: str, cache_dir: Optional[Path]) -> Dict[str, Any]:
+    """The cache entry's metadata (sha256, format, validators) for ``source``, or {}."""
+    if not cache_dir:
+        return {}
+    meta_path = _cache_paths(cache_dir, source)[0]
+    try:
+        meta = json.loads(meta_path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return meta if meta.get('source') == _canonical_source(source) else {}
+
+
+def fetch_raw_spec(source: str, cache_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Download (or locate) the raw bytes of a spec without parsing them.
+    
+    This is the I/O-bound half of load_spec(), split out so batch mode can fetch many
+    specs from threads and hand the result to worker processes. Returns a picklable dict.
+    """
+    meta = read_cache_meta(source, cache_dir)
+    raw_cache = _cache_paths(cache_dir, source)[2] if cache_dir else None
+    
+    raw_temporary = False
+    if source.startswith(('http://', 'https://')):
+        if raw_cache is not None:
+            raw_path = raw_cache
+        else:
+            fd, tmp_name = tempfile.mkstemp(suffix=Path(urlparse(source).path).suffix)
+            os.close(fd)
+            raw_path, raw_temporary = Path(tmp_name), True
+        conditional = meta if raw_cache is not None and raw_cache.exists() else None
+        modified, validators = download_spec(source, raw_path, conditional)
+        hint = _suffix_hint(Path(urlparse(source).path).suffix)
+    else:
+        raw_path = Path(source)
+        if not raw_path.exists():
+            raise FileNotFoundError(f"Spec file not found: {source}")
+        modified, validators = True, {}
+        hint = _suffix_hint(raw_path.suffix)
+    
+    return {
+        'meta': meta,
+        'raw_path': raw_path,
+        'raw_temporary': raw_temporary,
+        'modified': modified,
+        'validators': validators,
+        'hint': hint,
+    }
+
+
+def load_spec(
+    source: str,
+    cache_dir: Optional[Path] = None,
+    stream: Optional[bool] = None,
+    fetched: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Fetch and parse a spec, serving the parsed form from ``cache_dir`` when unchanged.
+    
+    Remote specs are streamed to disk (the cache, or a temporary file) rather than read
+    into memory. With ``stream`` (default: automatic above STREAM_THRESHOLD_BYTES), JSON
+    specs are parsed with ijson and ``paths`` is never materialized as a whole. Pass
+    ``fetched`` (from fetch_raw_spec()) to skip the download step.
+    
+    Returns a dict with ``spec``, ``format``, ``sha256`` (of the raw document), ``cached``
+    (True when parsing was skipped), ``raw_path`` (the original bytes, to copy verbatim)
+    and ``raw_temporary`` (True if the caller should delete ``raw_path``).
+    """
+    if fetched is None:
+        fetched = fetch_raw_spec(source, cache_dir)
+    canonical = _canonical_source(source)
+    meta, raw_path, raw_temporary = fetched['meta'], fetched['raw_path'], fetched['raw_temporary']
+    modified, validators, hint = fetched['modified'], fetched['validators'], fetched['hint']
+    pickle_path = None
+    if cache_dir:
+        meta_path, pickle_path, _ = _cache_paths(cache_dir, source)
+    
+    # 304 Not Modified keeps the cached digest; otherwise hash the bytes on disk
+    digest = meta['sha256'] if not modified and meta.get('sha256') else file_sha256(raw_path)
+    result = {'sha256': digest, 'raw_path': raw_path, 'raw_temporary': raw_temporary, 'cached': False}
+    
+    with open(raw_path, 'rb') as f:
+        fmt = detect_spec_format(f.read(64), hint)
+    if stream is None:
+        stream = raw_path.stat().st_size > STREAM_THRESHOLD_BYTES
+    if stream and (fmt != 'json' or not HAS_IJSON):
+        print("ℹ️  Streaming needs a JSON spec and ijson (pip install ijson); parsing in memory")
+        stream = False
+    
+    if stream:
+        spec = load_streaming_spec(raw_path)
+    else:
+        if meta.get('sha256') == digest and pickle_path is not None:
+            spec = _load_cached_spec(pickle_path)
+            if spec is not None:
+                print(f"⚡ Using cached parse of spec ({digest[:12]})")
+                return {**result, 'spec': spec, 'format': meta['format'], 'cached': True}
+        spec, fmt = parse_spec_content(raw_path.read_bytes(), hint)
+    
+    if cache_dir:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Unique temporary names: batch workers may cache the same source concurrently
+        if not stream:
+            tmp_path = _temp_path(pickle_path)
+            try:
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump(spec, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, pickle_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+        else:
+            # Streamed specs are not pickled; drop the old parse so the new digest can't match it
+            pickle_path.unlink(missing_ok=True)
+        tmp_path = _temp_path(meta_path)
+        try:
+            tmp_path.write_text(json.dumps({
+                'source': canonical,
+                'sha256': digest,
+                'format': fmt,
+                **(validators if modified else {k: meta.get(k, '') for k in ('etag', 'last_modified')}),
+            }, indent=2))
+            os.replace(tmp_path, meta_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    
+    return {**result, 'spec': spec, 'format': fmt}
+
+
+def fetch_spec(source: str) -> Tuple[Dict[str, Any], str]:
+    """Fetch OpenAPI spec from URL or file path. Returns (spec_dict, format)."""
+    content, hint, _ = read_spec_source(source)
+    return parse_spec_content(content, hint)
+
+
+def read_skill_stamp(skill_dir: Path) -> Dict[str, Any]:
+    """Read the generation stamp of an existing skill folder (empty if none)."""
+    try:
+        return json.loads((skill_dir / STAMP_FILE).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
 def detect_openapi_version(spec: Dict[str, Any]) -> str:
     """Detect if spec is OpenAPI 3.x or Swagger 2.x."""
     if 'openapi' in spec:
@@ -128,81 +554,650 @@ def extract_security_schemes(spec: Dict[str, Any], version: str) -> Dict[str, An
         return spec.get('securityDefinitions', {})
 
 
+def _unescape_pointer_token(token: str) -> str:
+    """Decode a JSON-pointer reference token (RFC 6901)."""
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def iter_ref_nodes(node: Any):
+    """Yield every ``{"$ref": ...}`` object in a document, walking it iteratively."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            if isinstance(current.get('$ref'), str):
+                yield current
+            stack.extend(v for v in current.values() if isinstance(v, (dict, list)))
+        elif isinstance(current, list):
+            stack.extend(v for v in current if isinstance(v, (dict, list)))
+
+
+def iter_refs(node: Any):
+    """Yield every ``$ref`` string in a document."""
+    for ref_node in iter_ref_nodes(node):
+        yield ref_node['$ref']
+
+
+def load_document(uri: str) -> Tuple[Any, str]:
+    """Fetch and parse an external document referenced by ``$ref``. Returns (document, sha256)."""
+    content, hint, _ = read_spec_source(uri)
+    return parse_spec_content(content, hint, quiet=True)[0], hashlib.sha256(content).hexdigest()
+
+
+def _bundle_key(uri: str) -> str:
+    """Stable, pointer-safe key of an external document under ``x-bundled``."""
+    name = re.sub(r'[^A-Za-z0-9._-]+', '_', Path(urlparse(uri).path).name) or 'document'
+    return f"{hashlib.sha256(uri.encode('utf-8')).hexdigest()[:8]}-{name}"
+
+
+class RefResolver:
+    """Resolves ``$ref`` pointers against a spec.
+    
+    All local pointers used in the document are indexed in a single pass on first use, and
+    ``$ref`` chains are memoized, so each lookup afterwards is a dict hit. External references
+    (``./schemas/user.yaml#/User``, remote URLs) are loaded once per document and resolved
+    by a child resolver scoped to that document.
+    """
+    
+    def __init__(
+        self,
+        spec: Dict[str, Any],
+        base_uri: Optional[str] = None,
+        documents: Optional[Dict[str, 'RefResolver']] = None,
+        sha256: Optional[str] = None
+    ):
+        self.spec = spec
+        self.base_uri = base_uri
+        self.sha256 = sha256
+        self._documents = documents if documents is not None else {}
+        self._index: Optional[Dict[str, Any]] = None
+        self._resolved: Dict[str, Tuple[Any, 'RefResolver']] = {}
+    
+    def _lookup_pointer(self, pointer: str) -> Any:
+        """Walk a '/a/b' pointer from the root, reusing indexed prefixes."""
+        index = self._index if self._index is not None else {}
+        if pointer in index:
+            return index[pointer]
+        parent_pointer, _, token = pointer.rpartition('/')
+        parent = self._lookup_pointer(parent_pointer) if parent_pointer else self.spec
+        token = _unescape_pointer_token(token)
+        if isinstance(parent, (dict, StreamedPaths)):
+            node = parent.get(token, {})
+        elif isinstance(parent, list) and token.isdigit() and int(token) < len(parent):
+            node = parent[int(token)]
+        else:
+            node = {}
+        index[pointer] = node
+        return node
+    
+    def build_index(self) -> Dict[str, Any]:
+        """Index every local pointer referenced anywhere in the document."""
+        if self._index is None:
+            self._index = {'': self.spec}
+            for ref in set(iter_refs(self.spec)):
+                if ref.startswith('#/'):
+                    self._lookup_pointer(ref[1:])
+        return self._index
+    
+    def _document(self, uri: str) -> 'RefResolver':
+        """Load (once) and return the resolver for an external document."""
+        if uri not in self._documents:
+            doc, digest = load_document(uri)
+            self._documents[uri] = RefResolver(doc, uri, self._documents, digest)
+        return self._documents[uri]
+    
+    def _own_uri(self) -> Optional[str]:
+        """Absolute location of this document (None when unknown)."""
+        if not self.base_uri or self.base_uri.startswith(('http://', 'https://')):
+            return self.base_uri
+        return str(Path(self.base_uri).resolve())
+    
+    def _external_uris(self) -> set:
+        """Absolute locations of the documents this one references."""
+        uris = set()
+        refs = set(iter_refs(self.spec))
+        paths = self.spec.get('paths') if isinstance(self.spec, dict) else None
+        if isinstance(paths, StreamedPaths):
+            # iter_refs() does not descend into streamed paths: read them one item at a time
+            for _, path_item in paths.items():
+                refs.update(iter_refs(path_item))
+        for ref in refs:
+            location = ref.partition('#')[0]
+            if location:
+                uris.add(self._absolute_uri(location))
+        return uris
+    
+    def prefetch(self, workers: int = REF_FETCH_CONCURRENCY) -> int:
+        """Load every external document reachable from this one, concurrently.
+        
+        Documents are fetched and parsed from a thread pool, one wave per level of
+        nesting, and cached in the shared document map. Returns the number loaded.
+        """
+        own_uri = self._own_uri()
+        if own_uri:
+            # A document referring back to this one gets this resolver, not a copy
+            self._documents.setdefault(own_uri, self)
+        loaded = 0
+        pending = [uri for uri in self._external_uris() if uri not in self._documents]
+        while pending:
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pending)))) as pool:
+                docs = list(pool.map(load_document, pending))
+            discovered = set()
+            for uri, (doc, digest) in zip(pending, docs):
+                child = RefResolver(doc, uri, self._documents, digest)
+                self._documents[uri] = child
+                discovered |= child._external_uris()
+            loaded += len(pending)
+            pending = [uri for uri in discovered if uri not in self._documents]
+        return loaded
+    
+    def document_digests(self) -> Dict[str, str]:
+        """sha256 of every external document loaded so far, keyed by location."""
+        return {uri: doc.sha256 for uri, doc in sorted(self._documents.items()) if doc is not self}
+    
+    def bundle(self, workers: int = REF_FETCH_CONCURRENCY) -> int:
+        """Prefetch external documents and embed them in this spec under ``x-bundled``.
+        
+        Every external ``$ref`` (and every local ``$ref`` inside a bundled document) is
+        rewritten to a pointer into the bundle, so the result resolves as one in-memory
+        document. In streaming mode ``paths`` cannot be rewritten, so documents are only
+        prefetched. Returns the number of bundled documents.
+        """
+        self.prefetch(workers)
+        documents = {uri: doc for uri, doc in self._documents.items() if doc is not self}
+        if not documents or isinstance(self.spec.get('paths'), StreamedPaths):
+            return 0
+        
+        prefixes = {uri: f"#/x-bundled/{_bundle_key(uri)}" for uri in documents}
+        for uri, doc in self._documents.items():
+            if doc is self:
+                prefixes[uri] = '#'
+        for resolver in [self, *documents.values()]:
+            own_prefix = '#' if resolver is self else prefixes[resolver.base_uri]
+            for ref_node in iter_ref_nodes(resolver.spec):
+                location, _, fragment = ref_node['$ref'].partition('#')
+                if fragment and not fragment.startswith('/'):
+                    continue  # Plain-name anchors are left alone
+                if location:
+                    ref_node['$ref'] = prefixes[resolver._absolute_uri(location)] + fragment
+                elif resolver is not self:
+                    ref_node['$ref'] = own_prefix + fragment
+        
+        self.spec.setdefault('x-bundled', {}).update(
+            {_bundle_key(uri): doc.spec for uri, doc in documents.items()}
+        )
+        # The document changed: forget pointers indexed before bundling
+        self._index = None
+        self._resolved.clear()
+        return len(documents)
+    
+    def _absolute_uri(self, location: str) -> str:
+        """Make an external document location absolute relative to this document."""
+        if location.startswith(('http://', 'https://')) or not self.base_uri:
+            return location
+        if self.base_uri.startswith(('http://', 'https://')):
+            return urljoin(self.base_uri, location)
+        return str((Path(self.base_uri).parent / location).resolve())
+    
+    def _resolve_one(self, ref: str) -> Tuple[Any, 'RefResolver']:
+        """Resolve a single ref hop without following chains."""
+        location, _, fragment = ref.partition('#')
+        if location:
+            return self._document(self._absolute_uri(location))._resolve_one('#' + fragment)
+        if self._index is None:
+            self.build_index()
+        if not fragment.startswith('/'):
+            return self.spec, self
+        return self._lookup_pointer(fragment), self
+    
+    def resolve_with_scope(self, ref: str) -> Tuple[Any, 'RefResolver']:
+        """Resolve a ref (following chains) to (node, resolver of the document it lives in)."""
+        cached = self._resolved.get(ref)
+        if cached is not None:
+            return cached
+        
+        node, scope = self._resolve_one(ref)
+        # Follow $ref chains, guarding against pure ref loops
+        seen = {(id(self), ref)}
+        while isinstance(node, dict) and isinstance(node.get('$ref'), str):
+            key = (id(scope), node['$ref'])
+            if key in seen:
+                node = {}
+                break
+            seen.add(key)
+            node, scope = scope._resolve_one(node['$ref'])
+        
+        self._resolved[ref] = (node, scope)
+        return node, scope
+    
+    def resolve(self, ref: str) -> Any:
+        """Resolve a ref to its target node."""
+        return self.resolve_with_scope(ref)[0]
+    
+    def deref(self, node: Any) -> Any:
+        """Return the target of ``node`` if it is a ``$ref`` object, else the node itself."""
+        if isinstance(node, dict) and isinstance(node.get('$ref'), str):
+            return self.resolve(node['$ref'])
+        return node
+
+
+# One resolver per spec object, so the index and memo are shared by every caller
+_RESOLVERS: Dict[int, RefResolver] = {}
+
+
+def get_resolver(spec: Dict[str, Any], base_uri: Optional[str] = None) -> RefResolver:
+    """Return the shared resolver for ``spec``, creating it on first use."""
+    resolver = _RESOLVERS.get(id(spec))
+    if resolver is None or resolver.spec is not spec:
+        resolver = RefResolver(spec, base_uri)
+        _RESOLVERS[id(spec)] = resolver
+    elif base_uri and not resolver.base_uri:
+        resolver.base_uri = base_uri
+    return resolver
+
+
+def release_spec(spec: Dict[str, Any]) -> None:
+    """Forget the shared resolver and example builder of ``spec`` (frees its indexes and memos)."""
+    _RESOLVERS.pop(id(spec), None)
+    _EXAMPLE_BUILDERS.pop(id(spec), None)
+
+
 def resolve_ref(spec: Dict[str, Any], ref: str) -> Dict[str, Any]:
     """Resolve a $ref pointer in the spec."""
-    if not ref.startswith('#/'):
-        return {}
+    return get_resolver(spec).resolve(ref)
+
+
+# Marks a schema reached again while it is still being expanded
+_CYCLE = object()
+
+_STRING_FORMAT_EXAMPLES = {
+    'date': "2026-02-04",
+    'date-time': "2026-02-04T12:00:00Z",
+    'email': "user@example.com",
+    'uuid': "550e8400-e29b-41d4-a716-446655440000",
+    'uri': "https://example.com",
+}
+
+
+class SchemaExampleBuilder:
+    """Synthesizes example values from schemas, memoized per resolved schema node.
     
-    parts = ref[2:].split('/')
-    current = spec
-    for part in parts:
-        # Handle URL encoding
-        part = part.replace('~1', '/').replace('~0', '~')
-        if isinstance(current, dict):
-            current = current.get(part, {})
-        else:
-            return {}
-    return current
+    A component referenced by hundreds of operations is expanded once. Recursion is
+    detected by node identity; an example truncated by a cycle through one of its
+    ancestors is not memoized, so every cached example is independent of where it was
+    first reached. Returned examples are shared and must be treated as read-only.
+    """
+    
+    def __init__(self, resolver: RefResolver):
+        self.resolver = resolver
+        self._cache: Dict[int, Any] = {}
+        # id(schema) -> depth on the current expansion stack
+        self._active: Dict[int, int] = {}
+    
+    def example(self, schema: Any) -> Any:
+        """Example value for ``schema`` (None when nothing sensible can be built)."""
+        value, _ = self._build(schema, self.resolver)
+        return None if value is _CYCLE else value
+    
+    def _build(self, schema: Any, resolver: RefResolver) -> Tuple[Any, float]:
+        """Return (example, lowest stack depth reached by a cycle inside this subtree)."""
+        if isinstance(schema, dict) and '$ref' in schema:
+            schema, resolver = resolver.resolve_with_scope(schema['$ref'])
+        if not isinstance(schema, dict):
+            return None, float('inf')
+        
+        key = id(schema)
+        if key in self._cache:
+            return self._cache[key], float('inf')
+        if key in self._active:
+            return _CYCLE, self._active[key]
+        
+        depth = len(self._active)
+        self._active[key] = depth
+        try:
+            value, low = self._build_node(schema, resolver)
+        finally:
+            del self._active[key]
+        
+        if low >= depth:
+            # Self-contained (at most recursive into itself): safe to share
+            self._cache[key] = value
+            return value, float('inf')
+        return value, low
+    
+    def _build_node(self, schema: Dict[str, Any], resolver: RefResolver) -> Tuple[Any, float]:
+        """Example for a dereferenced, non-cached schema node."""
+        # Check for explicit example
+        if 'example' in schema:
+            return schema['example'], float('inf')
+        if isinstance(schema.get('examples'), list) and schema['examples']:
+            return schema['examples'][0], float('inf')
+        for key in ('default', 'const'):
+            if key in schema:
+                return schema[key], float('inf')
+        if schema.get('enum'):
+            return schema['enum'][0], float('inf')
+        
+        if 'allOf' in schema:
+            return self._merge_all_of(schema, resolver)
+        for key in ('oneOf', 'anyOf'):
+            if key in schema:
+                low = float('inf')
+                for branch in schema[key]:
+                    value, branch_low = self._build(branch, resolver)
+                    low = min(low, branch_low)
+                    if value is not _CYCLE:
+                        return value, low
+                return _CYCLE, low
+        
+        schema_type = schema.get('type')
+        if isinstance(schema_type, list):
+            # OpenAPI 3.1 nullable types: ['string', 'null']
+            non_null = [t for t in schema_type if t != 'null']
+            schema_type = non_null[0] if non_null else 'null'
+        if schema_type is None:
+            if 'properties' in schema or 'additionalProperties' in schema:
+                schema_type = 'object'
+            elif 'items' in schema:
+                schema_type = 'array'
+            elif schema.get('nullable') or schema.get('x-nullable'):
+                return None, float('inf')
+            else:
+                schema_type = 'object'
+        
+        if schema_type == 'string':
+            return _STRING_FORMAT_EXAMPLES.get(schema.get('format', ''), "string"), float('inf')
+        elif schema_type == 'integer':
+            return 0, float('inf')
+        elif schema_type == 'number':
+            return 0.0, float('inf')
+        elif schema_type == 'boolean':
+            return True, float('inf')
+        elif schema_type == 'null':
+            return None, float('inf')
+        elif schema_type == 'array':
+            item, low = self._build(schema.get('items', {}), resolver)
+            # A recursive item type yields an empty list rather than infinite nesting
+            return ([] if item is _CYCLE else [item]), low
+        elif schema_type == 'object':
+            result = {}
+            low = float('inf')
+            for key, prop_schema in schema.get('properties', {}).items():
+                value, prop_low = self._build(prop_schema, resolver)
+                low = min(low, prop_low)
+                if value is not _CYCLE:
+                    result[key] = value
+            extra = schema.get('additionalProperties')
+            if isinstance(extra, dict):
+                value, extra_low = self._build(extra, resolver)
+                low = min(low, extra_low)
+                if value is not _CYCLE:
+                    result['additionalProp1'] = value
+            return result, low
+        
+        return None, float('inf')
+    
+    def _merge_all_of(self, schema: Dict[str, Any], resolver: RefResolver) -> Tuple[Any, float]:
+        """Merge the examples of every allOf member (plus sibling properties)."""
+        merged: Any = None
+        low = float('inf')
+        siblings = {k: v for k, v in schema.items() if k != 'allOf'}
+        parts = list(schema['allOf']) + ([siblings] if 'properties' in siblings else [])
+        for part in parts:
+            value, part_low = self._build(part, resolver)
+            low = min(low, part_low)
+            if value is _CYCLE or value is None:
+                continue
+            if isinstance(value, dict) and (merged is None or isinstance(merged, dict)):
+                # Copy: member examples are shared through the cache
+                merged = {**(merged or {}), **value}
+            else:
+                merged = value
+        return merged, low
+
+
+# One builder per spec object, so examples of shared components are built once
+_EXAMPLE_BUILDERS: Dict[int, SchemaExampleBuilder] = {}
+
 
+def get_example_builder(spec: Dict[str, Any]) -> SchemaExampleBuilder:
+    """Return the shared example builder for ``spec``."""
+    resolver = get_resolver(spec)
+    builder = _EXAMPLE_BUILDERS.get(id(spec))
+    if builder is None or builder.resolver is not resolver:
+        builder = SchemaExampleBuilder(resolver)
+        _EXAMPLE_BUILDERS[id(spec)] = builder
+    return builder
 
-def extract_schema_example(schema: Dict[str, Any], spec: Dict[str, Any], depth: int = 0) -> Any:
+
+def extract_schema_example(schema: Dict[str, Any], spec: Dict[str, Any]) -> Any:
     """Generate an example value from a schema."""
-    if depth > 5:
-        return "..."
-    
-    # Handle $ref
-    if '$ref' in schema:
-        resolved = resolve_ref(spec, schema['$ref'])
-        return extract_schema_example(resolved, spec, depth + 1)
-    
-    # Check for explicit example
-    if 'example' in schema:
-        return schema['example']
-    if 'default' in schema:
-        return schema['default']
-    
-    schema_type = schema.get('type', 'object')
-    
-    if schema_type == 'string':
-        fmt = schema.get('format', '')
-        if fmt == 'date':
-            return "2026-02-04"
-        elif fmt == 'date-time':
-            return "2026-02-04T12:00:00Z"
-        elif fmt == 'email':
-            return "user@example.com"
-        elif fmt == 'uuid':
-            return "550e8400-e29b-41d4-a716-446655440000"
-        elif 'enum' in schema:
-            return schema['enum'][0]
-        return "string"
-    elif schema_type == 'integer':
-        return 0
-    elif schema_type == 'number':
-        return 0.0
-    elif schema_type == 'boolean':
-        return True
-    elif schema_type == 'array':
-        items = schema.get('items', {})
-        return [extract_schema_example(items, spec, depth + 1)]
-    elif schema_type == 'object':
-        props = schema.get('properties', {})
-        result = {}
-        for key, prop_schema in props.items():
-            result[key] = extract_schema_example(prop_schema, spec, depth + 1)
-        return result
+    return get_example_builder(spec).example(schema)
+
+
+# Query parameter and response field names that identify common pagination schemes
+_CURSOR_PARAMS = {'cursor', 'page_token', 'pagetoken', 'next_token', 'nexttoken', 'continuation',
+                  'continuation_token', 'continuationtoken', 'marker', 'starting_after', 'after'}
+_OFFSET_PARAMS = {'offset', 'skip'}
+_PAGE_PARAMS = {'page', 'page_number', 'pagenumber'}
+_LIMIT_PARAMS = {'limit', 'per_page', 'perpage', 'page_size', 'pagesize', 'size', 'count',
+                 'max_results', 'maxresults', 'top'}
+_NEXT_CURSOR_FIELDS = {'next_cursor', 'nextcursor', 'next_page_token', 'nextpagetoken', 'next_token',
+                       'nexttoken', 'continuation_token', 'continuationtoken', 'cursor', 'next_marker',
+                       'nextmarker', 'after'}
+_NEXT_LINK_FIELDS = {'next', 'next_url', 'nexturl', 'next_page', 'nextpage', 'next_link', 'nextlink'}
+_PAGE_CONTAINER_FIELDS = ('meta', 'pagination', 'paging', 'links', '_links', 'page_info', 'pageinfo')
+_ITEMS_FIELDS = ('data', 'items', 'results', 'records', 'entries', 'values', 'elements', 'content')
+
+
+def _schema_properties(schema: Any, resolver: RefResolver) -> Dict[str, Any]:
+    """Dereferenced top-level properties of an object schema (including allOf members)."""
+    schema = resolver.deref(schema)
+    if not isinstance(schema, dict):
+        return {}
+    props = {k: resolver.deref(v) for k, v in schema.get('properties', {}).items()}
+    for part in schema.get('allOf', []):
+        props.update(_schema_properties(part, resolver))
+    return props
+
+
+def detect_pagination(
+    method: str,
+    parameters: List[Dict[str, Any]],
+    responses: List[Dict[str, Any]],
+    resolver: RefResolver
+) -> Optional[Dict[str, Any]]:
+    """Detect cursor, next-link, offset/limit or page-number pagination of a GET operation.
+    
+    Returns a description for the generated client's ``--all-pages`` mode, or None:
+    ``style`` (cursor | link | offset | page), the request ``param`` and ``limit_param``,
+    and dotted response paths ``items`` (None = the body is the list), ``next`` and
+    ``has_more``. ``link_header`` marks APIs that may paginate via an RFC 8288 Link header.
+    """
+    if method != 'GET':
+        return None
+    
+    query = {p.get('name', ''): p for p in parameters if p.get('in') == 'query'}
+    by_lower = {name.lower(): name for name in query}
+    
+    def find_param(candidates: set, numeric: bool = False) -> Optional[str]:
+        for lower, name in by_lower.items():
+            if lower not in candidates:
+                continue
+            param = query[name]
+            param_schema = resolver.deref(param.get('schema', param))
+            if numeric and isinstance(param_schema, dict) and param_schema.get('type') not in (None, 'integer', 'number'):
+                continue  # e.g. a date-valued 'page' filter
+            return name
+        return None
     
+    # Locate the list of records and next-page pointers in the success response
+    success = next((r for r in responses if r['status'].startswith('2') and 'schema' in r), None)
+    schema = resolver.deref(success['schema']) if success else {}
+    items: Optional[str] = None
+    next_cursor = next_link = has_more = None
+    if isinstance(schema, dict) and schema.get('type') == 'array':
+        items = ''
+    props = _schema_properties(schema, resolver) if items is None else {}
+    for name, prop in props.items():
+        lower = name.lower()
+        if items is None and isinstance(prop, dict) and prop.get('type') == 'array':
+            if lower in _ITEMS_FIELDS or not any(p.lower() in _ITEMS_FIELDS for p in props):
+                items = name
+        elif lower in ('has_more', 'hasmore', 'has_next', 'hasnext', 'more'):
+            has_more = name
+        elif lower in _NEXT_CURSOR_FIELDS:
+            next_cursor = name
+        elif lower in _NEXT_LINK_FIELDS:
+            next_link = name
+        elif lower in _PAGE_CONTAINER_FIELDS:
+            for sub_name, sub in _schema_properties(prop, resolver).items():
+                sub_lower = sub_name.lower()
+                if sub_lower in _NEXT_CURSOR_FIELDS or sub_lower in ('endcursor', 'end_cursor'):
+                    next_cursor = next_cursor or f"{name}.{sub_name}"
+                elif sub_lower in _NEXT_LINK_FIELDS:
+                    # HAL style: _links.next.href
+                    href = 'href' in _schema_properties(sub, resolver)
+                    next_link = next_link or f"{name}.{sub_name}" + ('.href' if href else '')
+                elif sub_lower in ('has_more', 'hasmore', 'has_next', 'hasnext', 'hasnextpage'):
+                    has_more = has_more or f"{name}.{sub_name}"
+    
+    limit_param = find_param(_LIMIT_PARAMS)
+    base = {'items': items, 'limit_param': limit_param, 'has_more': has_more, 'link_header': False}
+    
+    cursor_param = find_param(_CURSOR_PARAMS)
+    if cursor_param and (next_cursor or has_more):
+        # Without a cursor field (Stripe style), the cursor is the last record's id
+        return {**base, 'style': 'cursor', 'param': cursor_param, 'next': next_cursor}
+    if next_link:
+        return {**base, 'style': 'link', 'param': None, 'next': next_link}
+    # Offset and page numbers only stop on an empty or short page, so they need a records array
+    offset_param = find_param(_OFFSET_PARAMS, numeric=True) if items is not None else None
+    if offset_param:
+        return {**base, 'style': 'offset', 'param': offset_param, 'next': None}
+    page_param = find_param(_PAGE_PARAMS, numeric=True) if items is not None else None
+    if page_param:
+        # Page-numbered APIs (e.g. GitHub) often also send a Link header
+        return {**base, 'style': 'page', 'param': page_param, 'next': None, 'link_header': True}
+    if cursor_param:
+        # A cursor parameter with no cursor in the body: expect a Link header
+        return {**base, 'style': 'link', 'param': None, 'next': None, 'link_header': True}
     return None
 
 
+# Keywords copied verbatim into compiled validation schemas
+_VALIDATION_KEYWORDS = (
+    'enum', 'const', 'minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum',
+    'minLength', 'maxLength', 'pattern', 'minItems', 'maxItems', 'uniqueItems',
+    'required', 'minProperties', 'maxProperties',
+)
+
+
+class ValidationCompiler:
+    """Compiles schemas into the self-contained JSON form checked by the generated client.
+    
+    Only validation keywords are kept. Every ``$ref`` target is compiled once into ``defs``
+    and referenced as ``{"$def": index}``, so shared and recursive schemas stay finite.
+    Properties marked ``readOnly`` are never required in a request.
+    """
+    
+    def __init__(self, resolver: RefResolver):
+        self.resolver = resolver
+        self.defs: List[Dict[str, Any]] = []
+        self._def_index: Dict[int, int] = {}
+    
+    def compile(self, schema: Any, resolver: Optional[RefResolver] = None) -> Dict[str, Any]:
+        """Compiled form of ``schema`` (``{}`` accepts anything)."""
+        resolver = resolver or self.resolver
+        if isinstance(schema, dict) and isinstance(schema.get('$ref'), str):
+            node, scope = resolver.resolve_with_scope(schema['$ref'])
+            key = id(node)
+            if key not in self._def_index:
+                # Reserve the slot first so a cycle back to this node finds it
+                self._def_index[key] = len(self.defs)
+                self.defs.append({})
+                self.defs[self._def_index[key]] = self._compile_node(node, scope)
+            return {'$def': self._def_index[key]}
+        if not isinstance(schema, dict):
+            return {}
+        return self._compile_node(schema, resolver)
+    
+    def _compile_node(self, schema: Any, resolver: RefResolver) -> Dict[str, Any]:
+        if not isinstance(schema, dict):
+            return {}
+        compiled: Dict[str, Any] = {k: schema[k] for k in _VALIDATION_KEYWORDS if k in schema}
+        
+        types = schema.get('type')
+        if isinstance(types, str):
+            types = [types]
+        if isinstance(types, list) and types:
+            if schema.get('nullable') and 'null' not in types:
+                types = types + ['null']
+            compiled['type'] = types
+        
+        # OpenAPI 3.0 / Swagger 2 boolean exclusive bounds
+        for bound, exclusive in (('minimum', 'exclusiveMinimum'), ('maximum', 'exclusiveMaximum')):
+            if isinstance(compiled.get(exclusive), bool):
+                if compiled.pop(exclusive) and bound in compiled:
+                    compiled[exclusive] = compiled.pop(bound)
+        
+        properties = schema.get('properties')
+        if isinstance(properties, dict):
+            compiled['properties'] = {name: self.compile(sub, resolver) for name, sub in properties.items()}
+            read_only = {
+                name for name, sub in properties.items()
+                if isinstance(resolver.deref(sub), dict) and resolver.deref(sub).get('readOnly')
+            }
+            if read_only and isinstance(compiled.get('required'), list):
+                compiled['required'] = [name for name in compiled['required'] if name not in read_only]
+        additional = schema.get('additionalProperties')
+        if isinstance(additional, bool):
+            compiled['additionalProperties'] = additional
+        elif isinstance(additional, dict):
+            compiled['additionalProperties'] = self.compile(additional, resolver)
+        if isinstance(schema.get('items'), dict):
+            compiled['items'] = self.compile(schema['items'], resolver)
+        for key in ('allOf', 'anyOf', 'oneOf'):
+            if isinstance(schema.get(key), list):
+                compiled[key] = [self.compile(sub, resolver) for sub in schema[key]]
+        return compiled
+
+
+def compile_validation(
+    parameters: List[Dict[str, Any]],
+    request_body: Optional[Dict[str, Any]],
+    resolver: RefResolver
+) -> Dict[str, Any]:
+    """Compiled parameter and JSON body schemas of one operation, for client-side validation."""
+    compiler = ValidationCompiler(resolver)
+    compiled_params = {}
+    for param in parameters:
+        if param.get('in') not in ('path', 'query', 'header') or not param.get('name'):
+            continue
+        # Swagger 2 puts the schema keywords on the parameter itself
+        schema = param['schema'] if 'schema' in param else {k: v for k, v in param.items() if k != 'required'}
+        compiled_params[param['name']] = {
+            'in': param['in'],
+            'required': bool(param.get('required')) or param['in'] == 'path',
+            'schema': compiler.compile(schema),
+        }
+    body = None
+    if request_body is not None:
+        body = {'required': bool(request_body['required']), 'schema': compiler.compile(request_body['schema'])}
+    return {'parameters': compiled_params, 'body': body, 'defs': compiler.defs}
+
+
 def extract_operations(spec: Dict[str, Any], version: str) -> List[Dict[str, Any]]:
     """Extract all operations from the spec."""
     operations = []
     paths = spec.get('paths', {})
     
+    resolver = get_resolver(spec)
+    
     for path, path_item in paths.items():
+        path_item = resolver.deref(path_item)
         # Path-level parameters
-        path_params = path_item.get('parameters', [])
+        path_params = [resolver.deref(p) for p in path_item.get('parameters', [])]
         
         for method in ['get', 'post', 'put', 'patch', 'delete', 'options', 'head']:
             if method not in path_item:
@@ -212,12 +1207,12 @@ def extract_operations(spec: Dict[str, Any], version: str) -> List[Dict[str, Any
             operation_id = op.get('operationId', f"{method}_{normalize_name(path)}")
             
             # Combine path and operation parameters
-            all_params = path_params + op.get('parameters', [])
+            all_params = path_params + [resolver.deref(p) for p in op.get('parameters', [])]
             
             # Extract request body (OpenAPI 3.x)
             request_body = None
             if version == 'openapi3' and 'requestBody' in op:
-                rb = op['requestBody']
+                rb = resolver.deref(op['requestBody'])
                 content = rb.get('content', {})
                 # Prefer JSON
                 if 'application/json' in content:
@@ -232,6 +1227,7 @@ def extract_operations(spec: Dict[str, Any], version: str) -> List[Dict[str, Any
             # Extract responses
             responses = []
             for status, resp in op.get('responses', {}).items():
+                resp = resolver.deref(resp)
                 resp_info = {
                     'status': status,
                     'description': resp.get('description', '')
@@ -258,21 +1254,136 @@ def extract_operations(spec: Dict[str, Any], version: str) -> List[Dict[str, Any
                 'responses': responses,
                 'tags': op.get('tags', []),
                 'security': op.get('security', []),
-                'deprecated': op.get('deprecated', False)
+                'deprecated': op.get('deprecated', False),
+                'cache_ttl': op.get('x-cache-ttl'),
+                'pagination': detect_pagination(method.upper(), all_params, responses, resolver),
+                'validation': compile_validation(all_params, request_body, resolver),
             })
     
     return operations
 
 
+def group_operations_by_tag(operations: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Group operations by tag (untagged operations go under 'default')."""
+    tags_map: Dict[str, List[Dict[str, Any]]] = {}
+    for op in operations:
+        for tag in (op['tags'] or ['default']):
+            tags_map.setdefault(tag, []).append(op)
+    return tags_map
+
+
+def render_operation(op: Dict[str, Any]) -> List[str]:
+    """Render the markdown section of a single operation."""
+    lines = []
+    deprecated = " ⚠️ DEPRECATED" if op['deprecated'] else ""
+    lines.append(f"#### `{op['operation_id']}`{deprecated}")
+    lines.append("")
+    lines.append(f"**{op['method']}** `{op['path']}`")
+    lines.append("")
+    
+    if op['summary']:
+        lines.append(op['summary'])
+        lines.append("")
+    
+    # Parameters (already dereferenced by extract_operations)
+    if op['parameters']:
+        lines.append("**Parameters:**")
+        lines.append("")
+        for param in op['parameters']:
+            name = param.get('name', 'unknown')
+            location = param.get('in', 'query')
+            required = "required" if param.get('required', False) else "optional"
+            param_type = param.get('schema', {}).get('type', param.get('type', 'string'))
+            desc = param.get('description', '')
+            
+            lines.append(f"- `{name}` ({location}, {param_type}, {required}): {desc}")
+        lines.append("")
+    
+    # Request body
+    if op['request_body']:
+        rb = op['request_body']
+        lines.append(f"**Request Body:** `{rb['content_type']}`")
+        lines.append("")
+        if rb['example']:
+            lines.append("```json")
+            lines.append(json.dumps(rb['example'], indent=2))
+            lines.append("```")
+            lines.append("")
+    
+    if op.get('pagination'):
+        pagination = op['pagination']
+        param = f" (`{pagination['param']}`)" if pagination['param'] else ""
+        lines.append(f"**Pagination:** {pagination['style']}{param}; use `--all-pages` to stream every record")
+        lines.append("")
+    
+    # Response
+    success_responses = [r for r in op['responses'] if r['status'].startswith('2')]
+    if success_responses:
+        resp = success_responses[0]
+        lines.append(f"**Response ({resp['status']}):** {resp['description']}")
+        lines.append("")
+    
+    return lines
+
+
+def _render_view(op: Dict[str, Any]) -> Dict[str, Any]:
+    """The subset of an operation render_operation() needs (cheap to send to workers)."""
+    view = {k: op[k] for k in ('operation_id', 'method', 'path', 'summary', 'parameters', 'deprecated', 'pagination')}
+    view['request_body'] = op['request_body'] and {
+        'content_type': op['request_body']['content_type'],
+        'example': op['request_body']['example'],
+    }
+    view['responses'] = [{'status': r['status'], 'description': r['description']} for r in op['responses']]
+    return view
+
+
+def render_tag_reference(title: str, tag: str, tag_ops: List[Dict[str, Any]]) -> str:
+    """Render the standalone reference file for one tag (split output mode)."""
+    lines = [f"# {title}: {tag.title()}", "", f"**Operations in this tag:** {len(tag_ops)}", ""]
+    for op in tag_ops:
+        lines.extend(render_operation(op))
+    return '\n'.join(lines)
+
+
+def _render_tag_reference_task(task: Tuple[str, str, List[Dict[str, Any]]]) -> Tuple[str, str]:
+    """Process-pool entry point: (title, tag, ops) -> (tag, markdown)."""
+    title, tag, tag_ops = task
+    return tag, render_tag_reference(title, tag, tag_ops)
+
+
+def render_tag_references(
+    title: str,
+    tags_map: Dict[str, List[Dict[str, Any]]],
+    jobs: Optional[int] = None
+) -> Dict[str, str]:
+    """Render every tag reference file, in worker processes when there are several tags."""
+    tasks = [(title, tag, [_render_view(op) for op in tag_ops]) for tag, tag_ops in tags_map.items()]
+    jobs = jobs if jobs is not None else (os.cpu_count() or 1)
+    if jobs <= 1 or len(tasks) <= 1:
+        return dict(map(_render_tag_reference_task, tasks))
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        return dict(pool.map(_render_tag_reference_task, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+
+
+def tag_reference_path(tag: str) -> str:
+    """Skill-relative path of a tag's reference file."""
+    return f"references/operations/{slugify(tag) or 'default'}.md"
+
+
 def generate_skill_md(
     spec: Dict[str, Any],
     version: str,
     operations: List[Dict[str, Any]],
     skill_name: str,
     base_url: str,
-    security_schemes: Dict[str, Any]
+    security_schemes: Dict[str, Any],
+    split: bool = False
 ) -> str:
-    """Generate the SKILL.md content."""
+    """Generate the SKILL.md content.
+    
+    With ``split``, operations are not inlined: SKILL.md becomes a compact index linking
+    to one reference file per tag (see render_tag_references()).
+    """
     
     title = spec.get('info', {}).get('title', skill_name)
     description = spec.get('info', {}).get('description', f"Integration with {title} API")
@@ -280,10 +1391,7 @@ def generate_skill_md(
     
     # Build tool definitions for frontmatter
     # Group by tags
-    tags_map: Dict[str, List[Dict[str, Any]]] = {}
-    for op in operations:
-        for tag in (op['tags'] or ['default']):
-            tags_map.setdefault(tag, []).append(op)
+    tags_map = group_operations_by_tag(operations)
     
     # Generate frontmatter description
     op_summaries = [op['summary'] or op['operation_id'] for op in operations[:10]]
@@ -346,59 +1454,29 @@ def generate_skill_md(
     lines.append("## Operations")
     lines.append("")
     
-    for tag, tag_ops in tags_map.items():
-        lines.append(f"### {tag.title()}")
+    if split:
+        lines.append("Each tag's operations are documented in their own reference file; "
+                     "load only the one you need.")
         lines.append("")
-        
-        for op in tag_ops:
-            deprecated = " ⚠️ DEPRECATED" if op['deprecated'] else ""
-            lines.append(f"#### `{op['operation_id']}`{deprecated}")
-            lines.append("")
-            lines.append(f"**{op['method']}** `{op['path']}`")
+        lines.append("| Tag | Operations | Reference |")
+        lines.append("|-----|------------|-----------|")
+        for tag, tag_ops in tags_map.items():
+            ids = ', '.join(f"`{op['operation_id']}`" for op in tag_ops[:8])
+            if len(tag_ops) > 8:
+                ids += f", …(+{len(tag_ops) - 8})"
+            path = tag_reference_path(tag)
+            lines.append(f"| {tag.title()} | {ids} | [{path}]({path}) |")
+        lines.append("")
+    else:
+        for tag, tag_ops in tags_map.items():
+            lines.append(f"### {tag.title()}")
             lines.append("")
             
-            if op['summary']:
-                lines.append(op['summary'])
-                lines.append("")
-            
-            # Parameters
-            if op['parameters']:
-                lines.append("**Parameters:**")
-                lines.append("")
-                for param in op['parameters']:
-                    # Resolve $ref if present
-                    if '$ref' in param:
-                        param = resolve_ref(spec, param['$ref'])
-                    
-                    name = param.get('name', 'unknown')
-                    location = param.get('in', 'query')
-                    required = "required" if param.get('required', False) else "optional"
-                    param_type = param.get('schema', {}).get('type', param.get('type', 'string'))
-                    desc = param.get('description', '')
-                    
-                    lines.append(f"- `{name}` ({location}, {param_type}, {required}): {desc}")
-                lines.append("")
+            for op in tag_ops:
+                lines.extend(render_operation(op))
             
-            # Request body
-            if op['request_body']:
-                rb = op['request_body']
-                lines.append(f"**Request Body:** `{rb['content_type']}`")
-                lines.append("")
-                if rb['example']:
-                    lines.append("```json")
-                    lines.append(json.dumps(rb['example'], indent=2))
-                    lines.append("```")
-                    lines.append("")
-            
-            # Response
-            success_responses = [r for r in op['responses'] if r['status'].startswith('2')]
-            if success_responses:
-                resp = success_responses[0]
-                lines.append(f"**Response ({resp['status']}):** {resp['description']}")
-                lines.append("")
-        
-        lines.append("---")
-        lines.append("")
+            lines.append("---")
+            lines.append("")
     
     # Usage section
     lines.append("## Usage")
@@ -409,15 +1487,144 @@ def generate_skill_md(
     lines.append(f"python scripts/api_client.py <operation_id> [--param value ...]")
     lines.append("```")
     lines.append("")
+    lines.append("To find the right operation ID without reading every operation, search by keyword:")
+    lines.append("")
+    lines.append("```bash")
+    lines.append("python scripts/api_client.py --search \"<what you want to do>\" --top 5")
+    lines.append("```")
+    lines.append("")
+    lines.append("For many calls in one task, import it so every call reuses one pooled connection:")
+    lines.append("")
+    lines.append("```python")
+    lines.append("from api_client import call")
+    lines.append("")
+    lines.append("result = call(\"<operation_id>\", param=\"value\")")
+    lines.append("```")
+    lines.append("")
+    if any(op.get('pagination') for op in operations):
+        lines.append("Paginated operations can stream every record as JSONL (next page is prefetched):")
+        lines.append("")
+        lines.append("```bash")
+        lines.append("python scripts/api_client.py <operation_id> --all-pages [--max-pages N] > records.jsonl")
+        lines.append("```")
+        lines.append("")
+    lines.append("To fan out many calls, pipe JSONL requests into `--batch`; results stream back as JSONL:")
+    lines.append("")
+    lines.append("```bash")
+    lines.append("echo '{\"operation\": \"<operation_id>\", \"params\": {\"param\": \"value\"}}' | "
+                 "python scripts/api_client.py --batch - --concurrency 20")
+    lines.append("```")
+    lines.append("")
+    env_prefix = skill_name.upper().replace('-', '_')
     lines.append("**Environment variables:**")
     lines.append("")
-    lines.append(f"- `{skill_name.upper().replace('-', '_')}_BASE_URL`: API base URL")
-    lines.append(f"- `{skill_name.upper().replace('-', '_')}_API_KEY`: API key (if required)")
+    lines.append(f"- `{env_prefix}_BASE_URL`: API base URL")
+    lines.append(f"- `{env_prefix}_API_KEY`: API key (if required)")
+    lines.append(f"- `{env_prefix}_TIMEOUT`: Request timeout in seconds (default: 30)")
+    lines.append(f"- `{env_prefix}_MAX_CONNECTIONS`: Connection pool size (default: 20)")
+    lines.append(f"- `{env_prefix}_HTTP2`: Set to `1` to use HTTP/2 (needs `h2`)")
+    lines.append(f"- `{env_prefix}_CONCURRENCY`: In-flight requests for `--batch` (default: 10)")
+    lines.append(f"- `{env_prefix}_CACHE`: Set to `1` (or pass `--cache`) to cache GET/HEAD responses on disk")
+    lines.append(f"- `{env_prefix}_CACHE_TTL`: Cache TTL in seconds when the server sends no Cache-Control (default: 60)")
+    lines.append(f"- `{env_prefix}_CACHE_TTLS`: JSON map of per-operation or `tag:<name>` TTLs")
+    lines.append(f"- `{env_prefix}_VALIDATE`: Set to `0` (or pass `--no-validate`) to skip local request validation")
+    lines.append(f"- `{env_prefix}_RATE_LIMIT`: Maximum requests per second across all calls (default: unlimited)")
+    lines.append(f"- `{env_prefix}_MAX_RETRIES`: Retries of idempotent requests on 429/5xx (default: 3)")
     lines.append("")
     
     return '\n'.join(lines)
 
 
+def operation_shard_count(num_operations: int) -> int:
+    """Number of operations/<shard>.json files for a spec."""
+    return max(1, -(-num_operations // OPERATIONS_PER_SHARD))
+
+
+def operation_shard(op_id: str, shard_count: int) -> int:
+    """Stable shard of an operation ID (mirrored by the generated client)."""
+    return zlib.crc32(op_id.encode('utf-8')) % shard_count
+
+
+def client_operation(op: Dict[str, Any], index: int) -> Dict[str, Any]:
+    """The definition of one operation as stored for the generated client."""
+    def params_in(location: str) -> List[str]:
+        return [p.get('name', '') for p in op['parameters'] if p.get('in') == location]
+    
+    return {
+        'index': index,
+        'method': op['method'],
+        'path': op['path'],
+        'summary': op['summary'],
+        'tags': op['tags'],
+        'path_params': params_in('path'),
+        'query_params': params_in('query'),
+        'header_params': params_in('header'),
+        'has_body': op['request_body'] is not None,
+        'pagination': op.get('pagination'),
+        'cache_ttl': op.get('cache_ttl'),
+        'validation': op.get('validation'),
+    }
+
+
+def generate_operation_shards(operations: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Render the operations/<shard>.json files loaded lazily by the generated client."""
+    shard_count = operation_shard_count(len(operations))
+    shards: List[Dict[str, Any]] = [{} for _ in range(shard_count)]
+    for index, op in enumerate(operations):
+        shards[operation_shard(op['operation_id'], shard_count)][op['operation_id']] = client_operation(op, index)
+    return {f"{i:03d}.json": json.dumps(shard, separators=(',', ':')) for i, shard in enumerate(shards)}
+
+
+# BM25 term-frequency weight of each field in the operation search index
+SEARCH_FIELD_WEIGHTS = {'operation_id': 3, 'summary': 2, 'tags': 2, 'path': 1, 'parameters': 1, 'description': 1}
+SEARCH_TOKEN_RE = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+')
+
+
+def search_tokens(text: str) -> List[str]:
+    """Lowercased, lightly stemmed words of ``text``, splitting camelCase and snake_case."""
+    tokens = []
+    for token in SEARCH_TOKEN_RE.findall(text):
+        token = token.lower()
+        if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def generate_search_index(operations: List[Dict[str, Any]]) -> str:
+    """Build the BM25 inverted index behind the generated client's --search.
+    
+    Postings are flat ``[doc, weighted_tf, doc, weighted_tf, ...]`` lists keyed by term;
+    ``docs`` carries just enough per operation to print results without loading shards.
+    """
+    docs = []
+    lengths = []
+    postings: Dict[str, List[int]] = {}
+    for doc, op in enumerate(operations):
+        fields = {
+            'operation_id': f"{op['operation_id']} {op.get('original_id') or ''}",
+            'summary': op['summary'] or '',
+            'tags': ' '.join(op['tags']),
+            'path': op['path'],
+            'parameters': ' '.join(p.get('name', '') for p in op['parameters']),
+            'description': op['description'] or '',
+        }
+        term_freqs: Dict[str, int] = {}
+        for field, text in fields.items():
+            for token in search_tokens(text):
+                term_freqs[token] = term_freqs.get(token, 0) + SEARCH_FIELD_WEIGHTS[field]
+        for token, freq in term_freqs.items():
+            postings.setdefault(token, []).extend((doc, freq))
+        docs.append([op['operation_id'], op['method'], op['path'], op['summary'] or ''])
+        lengths.append(sum(term_freqs.values()))
+    return json.dumps({
+        'avgdl': sum(lengths) / len(lengths) if lengths else 0.0,
+        'docs': docs,
+        'lengths': lengths,
+        'postings': postings,
+    }, separators=(',', ':'))
+
+
 def generate_api_client(
     spec: Dict[str, Any],
     version: str,
@@ -438,19 +1645,64 @@ Auto-generated by OpenAPI to OpenClaw Skill Generator
 Usage:
     python api_client.py <operation_id> [--param value ...]
     python api_client.py --list  # List all operations
+    python api_client.py --search "create invoice" [--top 5]  # Find operations by keyword
+    python api_client.py --batch requests.jsonl [--concurrency 20]  # {{"operation": ..., "params": {{...}}}} per line
+    python api_client.py <operation_id> --all-pages  # Stream every record of a paginated operation as JSONL
+
+Python API (one pooled connection for many calls):
+    from api_client import call, call_async
+    result = call("<operation_id>", param="value")
 """
 
 import argparse
+import asyncio
+import atexit
+import hashlib
+import heapq
 import json
+import math
 import os
+import random
+import re
 import sys
-from typing import Any, Dict, Optional
+import threading
+import time
+import weakref
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple
 from urllib.parse import urljoin, urlencode
 
 # Configuration
 BASE_URL = os.environ.get("{env_prefix}_BASE_URL", "{base_url}")
 API_KEY = os.environ.get("{env_prefix}_API_KEY", "")
 AUTH_HEADER = os.environ.get("{env_prefix}_AUTH_HEADER", "Authorization")
+TIMEOUT = float(os.environ.get("{env_prefix}_TIMEOUT", "30"))
+MAX_CONNECTIONS = int(os.environ.get("{env_prefix}_MAX_CONNECTIONS", "20"))
+HTTP2 = os.environ.get("{env_prefix}_HTTP2", "").lower() in ("1", "true", "yes")
+CONCURRENCY = int(os.environ.get("{env_prefix}_CONCURRENCY", "10"))
+
+# Optional on-disk cache for GET/HEAD responses (Cache-Control/ETag aware)
+CACHE_ENABLED = os.environ.get("{env_prefix}_CACHE", "").lower() in ("1", "true", "yes")
+CACHE_DIR = Path(os.environ.get("{env_prefix}_CACHE_DIR", Path.home() / ".cache" / "{skill_name}-api"))
+CACHE_TTL = float(os.environ.get("{env_prefix}_CACHE_TTL", "60"))
+# Per-operation / per-tag TTLs in seconds, e.g. {{"get_pet_by_id": 300, "tag:store": 0}}
+CACHE_TTLS = json.loads(os.environ.get("{env_prefix}_CACHE_TTLS", "") or "{{}}")
+
+# Client-side rate limiting (requests per second, 0 = unlimited) and retries
+RATE_LIMIT = float(os.environ.get("{env_prefix}_RATE_LIMIT", "0"))
+RATE_BURST = int(os.environ.get("{env_prefix}_RATE_BURST", "0")) or max(1, int(RATE_LIMIT))
+MAX_RETRIES = int(os.environ.get("{env_prefix}_MAX_RETRIES", "3"))
+BACKOFF_BASE = float(os.environ.get("{env_prefix}_BACKOFF_BASE", "0.5"))
+BACKOFF_MAX = float(os.environ.get("{env_prefix}_BACKOFF_MAX", "30"))
+RETRY_STATUSES = {{429, 500, 502, 503, 504}}
+IDEMPOTENT_METHODS = {{"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}}
+
+# Check arguments against the operation's schemas before sending (disable with 0)
+VALIDATE = os.environ.get("{env_prefix}_VALIDATE", "1").lower() not in ("0", "false", "no")
 
 # Try httpx first, fall back to urllib
 try:
@@ -461,15 +1713,78 @@ except ImportError:
     import urllib.request
     import urllib.error
 
+_client = None
+_client_lock = threading.Lock()
+# One async client per event loop: an AsyncClient cannot outlive the loop it was used on
+_async_clients = weakref.WeakKeyDictionary()
 
-def make_request(
+
+def _http2_enabled() -> bool:
+    """HTTP/2 is used only when requested and the h2 package is installed."""
+    if not HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401  (httpx needs it for HTTP/2)
+    except ImportError:
+        return False
+    return True
+
+
+def _pool_limits() -> "httpx.Limits":
+    """Connection pool limits shared by the sync and async clients."""
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_CONNECTIONS,
+        keepalive_expiry=60,
+    )
+
+
+def get_client() -> "httpx.Client":
+    """Return the shared connection-pooled client, created on first use and closed at exit."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(timeout=TIMEOUT, http2=_http2_enabled(), limits=_pool_limits())
+                atexit.register(close)
+    return _client
+
+
+def get_async_client() -> "httpx.AsyncClient":
+    """Return the shared async client for the running event loop (close with aclose())."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(timeout=TIMEOUT, http2=_http2_enabled(), limits=_pool_limits())
+        _async_clients[loop] = client
+    return client
+
+
+def close():
+    """Close the shared client and its pooled connections."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+async def aclose():
+    """Close the running event loop's shared async client."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _prepare_request(
     method: str,
     path: str,
     params: Optional[Dict[str, Any]] = None,
     body: Optional[Dict[str, Any]] = None,
-    headers: Optional[Dict[str, str]] = None
+    headers: Optional[Dict[str, str]] = None,
+    cache_ttl: Optional[float] = None
 ) -> Dict[str, Any]:
-    """Make an HTTP request to the API."""
+    """Build the method, URL (with query string), headers and JSON body of a request."""
     
     url = urljoin(BASE_URL.rstrip('/') + '/', path.lstrip('/'))
     
@@ -481,71 +1796,592 @@ def make_request(
         req_headers.update(headers)
     
     # Add query params
-    if params and method.upper() == "GET":
-        url = f"{{url}}?{{urlencode(params)}}"
+    if params:
+        url = f"{{url}}?{{urlencode(params, doseq=True)}}"
+    
+    return {{
+        "method": method.upper(),
+        "url": url,
+        "headers": req_headers,
+        "json": body if body else None,
+        "cache_ttl": cache_ttl,
+    }}
+
+
+def _decode_body(status: int, text: str) -> Any:
+    """Return the JSON body, or status and text for non-JSON responses."""
+    try:
+        return json.loads(text) if text else None
+    except ValueError:
+        return {{"status": status, "text": text}}
+
+
+class _TokenBucket:
+    """Token-bucket rate limiter shared by every thread and task in the process.
+    
+    reserve() takes a token and returns how long the caller must wait for it, so the same
+    limiter serves time.sleep() and asyncio.sleep(). A 429 pauses the whole bucket.
+    """
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        with self.lock:
+            now = time.monotonic()
+            wait = 0.0
+            if self.rate > 0:
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate) - 1
+                self.updated = now
+                if self.tokens < 0:
+                    wait = -self.tokens / self.rate
+            return max(wait, self.paused_until - now)
+    
+    def pause(self, seconds: float):
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+_rate_limiter = _TokenBucket(RATE_LIMIT, RATE_BURST)
+
+if HAS_HTTPX:
+    RETRYABLE_ERRORS = (httpx.TransportError,)
+else:
+    RETRYABLE_ERRORS = (urllib.error.URLError, ConnectionError, TimeoutError)
+
+
+def _retry_after(headers: Any) -> Optional[float]:
+    """Seconds requested by a Retry-After header (delta-seconds or HTTP-date), capped at BACKOFF_MAX."""
+    value = (headers.get("Retry-After") or "").strip() if headers else ""
+    if not value:
+        return None
+    if value.isdigit():
+        return min(float(value), BACKOFF_MAX)
+    try:
+        return min(max(0.0, parsedate_to_datetime(value).timestamp() - time.time()), BACKOFF_MAX)
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_delay(request: Dict[str, Any], attempt: int, status: Optional[int], headers: Any) -> Optional[float]:
+    """Seconds to wait before retrying, or None if the request must not be retried.
     
+    Only idempotent methods are retried, on connection errors (status None) and on
+    429/5xx responses. Retry-After (capped at BACKOFF_MAX) wins over exponential
+    backoff with full jitter.
+    """
+    if attempt >= MAX_RETRIES or request["method"] not in IDEMPOTENT_METHODS:
+        return None
+    if status is not None and status not in RETRY_STATUSES:
+        return None
+    delay = _retry_after(headers)
+    if status == 429 and delay is not None:
+        # Everyone sharing the limiter backs off, not only this request
+        _rate_limiter.pause(delay)
+    if delay is None:
+        delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+    return delay
+
+
+def _transport_once(request: Dict[str, Any]) -> Tuple[int, Any, Any, Optional[Exception]]:
+    """One attempt at a prepared request. Returns (status, body, headers, error to raise if final)."""
     if HAS_HTTPX:
-        with httpx.Client(timeout=30) as client:
-            response = client.request(
-                method=method,
-                url=url,
-                headers=req_headers,
-                json=body if body else None,
-                params=params if method.upper() != "GET" else None
-            )
-            response.raise_for_status()
+        response = get_client().request(
+            request["method"], request["url"], headers=request["headers"], json=request["json"]
+        )
+        error = None
+        if response.status_code != 304 and response.is_error:
             try:
-                return response.json()
-            except:
-                return {{"status": response.status_code, "text": response.text}}
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                error = e
+        return response.status_code, _decode_body(response.status_code, response.text), response.headers, error
     else:
         # Fallback to urllib
-        data = json.dumps(body).encode('utf-8') if body else None
-        req = urllib.request.Request(url, data=data, headers=req_headers, method=method)
+        data = json.dumps(request["json"]).encode('utf-8') if request["json"] else None
+        req = urllib.request.Request(request["url"], data=data, headers=request["headers"], method=request["method"])
         try:
-            with urllib.request.urlopen(req) as resp:
-                content = resp.read().decode('utf-8')
-                try:
-                    return json.loads(content)
-                except:
-                    return {{"status": resp.status, "text": content}}
+            with urllib.request.urlopen(req, timeout=TIMEOUT) as resp:
+                return resp.status, _decode_body(resp.status, resp.read().decode('utf-8')), resp.headers, None
         except urllib.error.HTTPError as e:
-            return {{"error": str(e), "status": e.code, "body": e.read().decode('utf-8')}}
+            if e.code == 304:
+                return 304, None, e.headers, None
+            return e.code, {{"error": str(e), "status": e.code, "body": e.read().decode('utf-8')}}, e.headers, None
 
 
-# Operation definitions
-OPERATIONS = {{
-'''
+async def _transport_once_async(request: Dict[str, Any]) -> Tuple[int, Any, Any, Optional[Exception]]:
+    """Async variant of _transport_once() (runs the urllib fallback in a thread)."""
+    if not HAS_HTTPX:
+        return await asyncio.to_thread(_transport_once, request)
+    response = await get_async_client().request(
+        request["method"], request["url"], headers=request["headers"], json=request["json"]
+    )
+    error = None
+    if response.status_code != 304 and response.is_error:
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            error = e
+    return response.status_code, _decode_body(response.status_code, response.text), response.headers, error
+
+
+def _transport(request: Dict[str, Any]) -> Tuple[int, Any, Any]:
+    """Send a prepared request under the rate limiter, retrying transient failures.
     
-    # Add each operation
-    for op in operations:
-        path_params = [p for p in op['parameters'] if p.get('in') == 'path']
-        query_params = [p for p in op['parameters'] if p.get('in') == 'query']
-        header_params = [p for p in op['parameters'] if p.get('in') == 'header']
-        
-        code += f'''    "{op['operation_id']}": {{
-        "method": "{op['method']}",
-        "path": "{op['path']}",
-        "summary": """{op['summary']}""",
-        "path_params": {json.dumps([p.get('name', '') for p in path_params])},
-        "query_params": {json.dumps([p.get('name', '') for p in query_params])},
-        "header_params": {json.dumps([p.get('name', '') for p in header_params])},
-        "has_body": {op['request_body'] is not None},
-    }},
-'''
+    Returns (status, decoded body, case-insensitive headers). HTTP errors raise (httpx) or
+    come back as an error body (urllib); 304 is returned as is.
+    """
+    attempt = 0
+    while True:
+        time.sleep(_rate_limiter.reserve())
+        try:
+            status, body, headers, error = _transport_once(request)
+        except RETRYABLE_ERRORS:
+            delay = _retry_delay(request, attempt, None, None)
+            if delay is None:
+                raise
+        else:
+            delay = _retry_delay(request, attempt, status, headers) if status in RETRY_STATUSES else None
+            if delay is None:
+                if error is not None:
+                    raise error
+                return status, body, headers
+        attempt += 1
+        time.sleep(delay)
+
+
+async def _transport_async(request: Dict[str, Any]) -> Tuple[int, Any, Any]:
+    """Async variant of _transport()."""
+    attempt = 0
+    while True:
+        await asyncio.sleep(_rate_limiter.reserve())
+        try:
+            status, body, headers, error = await _transport_once_async(request)
+        except RETRYABLE_ERRORS:
+            delay = _retry_delay(request, attempt, None, None)
+            if delay is None:
+                raise
+        else:
+            delay = _retry_delay(request, attempt, status, headers) if status in RETRY_STATUSES else None
+            if delay is None:
+                if error is not None:
+                    raise error
+                return status, body, headers
+        attempt += 1
+        await asyncio.sleep(delay)
+
+
+# In-process layer over the on-disk cache: repeated lookups skip even the file read
+_memory_cache: Dict[str, Dict[str, Any]] = {{}}
+
+
+def _cache_key(request: Dict[str, Any]) -> str:
+    """Cache key of a request: method, URL and the headers that vary the response."""
+    vary = {{k: v for k, v in request["headers"].items() if k.lower() != "content-type"}}
+    raw = json.dumps([request["method"], request["url"], sorted(vary.items())])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _cache_lookup(request: Dict[str, Any]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Return (key, entry) for a cacheable request, or (None, None) if caching does not apply."""
+    if not CACHE_ENABLED or request["method"] not in ("GET", "HEAD") or request["cache_ttl"] == 0:
+        return None, None
+    key = _cache_key(request)
+    entry = _memory_cache.get(key)
+    if entry is None:
+        try:
+            with open(CACHE_DIR / f"{{key}}.json") as f:
+                entry = _memory_cache[key] = json.load(f)
+        except (OSError, ValueError):
+            entry = None
+    return key, entry
+
+
+def _cache_headers(headers: Any) -> Dict[str, str]:
+    """The response headers worth keeping with a cache entry."""
+    names = ("Link", "ETag", "Last-Modified", "Cache-Control")
+    return {{name: headers.get(name) for name in names if headers.get(name)}}
+
+
+def _freshness_lifetime(headers: Any, default_ttl: float) -> Optional[float]:
+    """Seconds a response stays fresh per Cache-Control; None if it must not be stored."""
+    directives = {{}}
+    for part in (headers.get("Cache-Control") or "").split(","):
+        name, _, value = part.strip().partition("=")
+        directives[name.lower()] = value.strip('"')
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0  # Store, but revalidate with the ETag on every use
+    if directives.get("max-age", "").isdigit():
+        age = headers.get("Age") or "0"
+        return max(0.0, float(directives["max-age"]) - (float(age) if age.isdigit() else 0.0))
+    return default_ttl
+
+
+def _cache_update(
+    key: str,
+    entry: Optional[Dict[str, Any]],
+    request: Dict[str, Any],
+    status: int,
+    body: Any,
+    headers: Any
+) -> Tuple[Any, Any]:
+    """Store a fresh 2xx response or refresh an entry revalidated with 304."""
+    if status == 304 and entry is not None:
+        # Not modified: keep the stored body, refresh the stored headers
+        body = entry["body"]
+        headers = {{**entry["headers"], **_cache_headers(headers)}}
+    elif not 200 <= status < 300:
+        return body, headers
+    ttl = request["cache_ttl"] if request["cache_ttl"] is not None else CACHE_TTL
+    lifetime = _freshness_lifetime(headers, ttl)
+    if lifetime is None:
+        return body, headers
     
-    code += '''}
+    stored = {{"expires_at": time.time() + lifetime, "body": body, "headers": _cache_headers(headers)}}
+    if not (lifetime or stored["headers"].get("ETag") or stored["headers"].get("Last-Modified")):
+        return body, headers  # Never fresh and cannot be revalidated: nothing to gain
+    _memory_cache[key] = stored
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = CACHE_DIR / f"{{key}}.{{os.getpid()}}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(stored, f)
+        os.replace(tmp_path, CACHE_DIR / f"{{key}}.json")
+    except OSError:
+        pass  # The cache is best-effort
+    return body, headers
 
 
-def execute_operation(op_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
-    """Execute an operation by ID with the given arguments."""
+def _conditional(request: Dict[str, Any], entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of ``request`` that revalidates a stale cache entry."""
+    headers = dict(request["headers"])
+    if entry["headers"].get("ETag"):
+        headers["If-None-Match"] = entry["headers"]["ETag"]
+    if entry["headers"].get("Last-Modified"):
+        headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+    return {{**request, "headers": headers}}
+
+
+def _send(request: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Send a prepared request through the response cache. Returns (body, headers)."""
+    key, entry = _cache_lookup(request)
+    if entry is not None:
+        if entry["expires_at"] > time.time():
+            return entry["body"], entry["headers"]
+        request = _conditional(request, entry)
+    status, body, headers = _transport(request)
+    if key is None:
+        return body, headers
+    return _cache_update(key, entry, request, status, body, headers)
+
+
+async def _send_async(request: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Async variant of _send()."""
+    key, entry = _cache_lookup(request)
+    if entry is not None:
+        if entry["expires_at"] > time.time():
+            return entry["body"], entry["headers"]
+        request = _conditional(request, entry)
+    status, body, headers = await _transport_async(request)
+    if key is None:
+        return body, headers
+    return _cache_update(key, entry, request, status, body, headers)
+
+
+def make_request(
+    method: str,
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    body: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    cache_ttl: Optional[float] = None
+) -> Dict[str, Any]:
+    """Make an HTTP request to the API."""
+    return _send(_prepare_request(method, path, params, body, headers, cache_ttl))[0]
+
+
+async def make_request_async(
+    method: str,
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    body: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    cache_ttl: Optional[float] = None
+) -> Dict[str, Any]:
+    """Async variant of make_request()."""
+    return (await _send_async(_prepare_request(method, path, params, body, headers, cache_ttl)))[0]
+
+
+# Operation definitions live in sharded JSON files next to this script and are loaded
+# on demand, so startup cost does not grow with the number of operations
+OPERATIONS_DIR = Path(__file__).resolve().parent / "operations"
+OPERATION_SHARDS = {operation_shard_count(len(operations))}
+'''
     
-    if op_id not in OPERATIONS:
+    code += '''
+
+def _operation_shard(op_id: str) -> int:
+    """Shard file holding an operation (must match the generator's operation_shard())."""
+    return zlib.crc32(op_id.encode("utf-8")) % OPERATION_SHARDS
+
+
+@lru_cache(maxsize=None)
+def _load_shard(shard: int) -> Dict[str, Dict[str, Any]]:
+    """Load one operations shard."""
+    with open(OPERATIONS_DIR / f"{shard:03d}.json") as f:
+        return json.load(f)
+
+
+def get_operation(op_id: str) -> Dict[str, Any]:
+    """Look up an operation definition by ID, loading only its shard."""
+    op = _load_shard(_operation_shard(op_id)).get(op_id)
+    if op is None:
         raise ValueError(f"Unknown operation: {op_id}. Use --list to see available operations.")
-    
-    op = OPERATIONS[op_id]
+    return op
+
+
+def iter_operations() -> List[Tuple[str, Dict[str, Any]]]:
+    """All operations in spec order (loads every shard)."""
+    operations: Dict[str, Dict[str, Any]] = {}
+    for shard in range(OPERATION_SHARDS):
+        operations.update(_load_shard(shard))
+    return sorted(operations.items(), key=lambda item: item[1]["index"])
+
+
+SEARCH_INDEX = Path(__file__).resolve().parent / "search_index.json"
+BM25_K1 = 1.2
+BM25_B = 0.75
+_SEARCH_TOKEN_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\\d+")
+
+
+def _search_tokens(text: str) -> List[str]:
+    """Query words, normalized exactly like the generator's search_tokens()."""
+    tokens = []
+    for token in _SEARCH_TOKEN_RE.findall(text):
+        token = token.lower()
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+@lru_cache(maxsize=None)
+def _search_index() -> Dict[str, Any]:
+    with open(SEARCH_INDEX) as f:
+        return json.load(f)
+
+
+def search_operations(query: str, top: int = 10) -> List[Dict[str, Any]]:
+    """Rank operations against a keyword query with BM25 over the prebuilt index."""
+    index = _search_index()
+    docs, lengths, postings = index["docs"], index["lengths"], index["postings"]
+    avgdl = index["avgdl"] or 1.0
+    scores: Dict[int, float] = {}
+    for token in set(_search_tokens(query)):
+        entries = postings.get(token)
+        if not entries:
+            continue
+        df = len(entries) // 2
+        idf = math.log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+        for i in range(0, len(entries), 2):
+            doc, tf = entries[i], entries[i + 1]
+            norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc] / avgdl)
+            scores[doc] = scores.get(doc, 0.0) + idf * tf * (BM25_K1 + 1) / norm
+
+    results = []
+    for doc, score in heapq.nlargest(top, scores.items(), key=lambda item: item[1]):
+        op_id, method, path, summary = docs[doc]
+        results.append({"operation_id": op_id, "method": method, "path": path,
+                        "summary": summary, "score": round(score, 3)})
+    return results
+
+
+class RequestValidationError(ValueError):
+    """Arguments do not match the operation's schemas; raised before anything is sent."""
+
+    def __init__(self, op_id: str, errors: List[str]):
+        self.errors = errors
+        shown = errors[:20] + ([f"...and {len(errors) - 20} more"] if len(errors) > 20 else [])
+        super().__init__(f"Invalid request for {op_id}:\\n  " + "\\n  ".join(shown))
+
+
+def _json_type(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "integer" if value.is_integer() else "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    if isinstance(value, dict):
+        return "object"
+    return type(value).__name__
+
+
+def _type_matches(value: Any, expected: str) -> bool:
+    actual = _json_type(value)
+    return actual == expected or (expected == "number" and actual == "integer")
+
+
+@lru_cache(maxsize=256)
+def _pattern(pattern: str) -> Optional["re.Pattern"]:
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return None
+
+
+def _coerce(value: Any, schema: Dict[str, Any], defs: List[Dict[str, Any]]) -> Any:
+    """Interpret a command-line string as the type its schema expects."""
+    if not isinstance(value, str):
+        return value
+    if "$def" in schema:
+        schema = defs[schema["$def"]]
+    for expected in schema.get("type", []):
+        if expected == "string":
+            return value
+        if expected in ("integer", "number"):
+            try:
+                return int(value) if expected == "integer" else float(value)
+            except ValueError:
+                continue
+        if expected == "boolean" and value.lower() in ("true", "false", "1", "0", "yes", "no"):
+            return value.lower() in ("true", "1", "yes")
+        if expected == "null" and value.lower() == "null":
+            return None
+        if expected == "array":
+            if value.startswith("["):
+                try:
+                    return json.loads(value)
+                except ValueError:
+                    continue
+            return [_coerce(item, schema.get("items", {}), defs) for item in value.split(",")]
+        if expected == "object":
+            try:
+                return json.loads(value)
+            except ValueError:
+                continue
+    return value
+
+
+def _check(value: Any, schema: Dict[str, Any], defs: List[Dict[str, Any]], where: str, errors: List[str]) -> None:
+    """Append a message to ``errors`` for every way ``value`` violates ``schema``."""
+    if "$def" in schema:
+        schema = defs[schema["$def"]]
+    types = schema.get("type")
+    if types and not any(_type_matches(value, t) for t in types):
+        errors.append(f"{where}: expected {' or '.join(types)}, got {_json_type(value)}")
+        return
+    if "enum" in schema and value not in schema["enum"]:
+        errors.append(f"{where}: {value!r} is not one of {schema['enum']}")
+    if "const" in schema and value != schema["const"]:
+        errors.append(f"{where}: must be {schema['const']!r}")
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if "minimum" in schema and value < schema["minimum"]:
+            errors.append(f"{where}: {value} is less than the minimum {schema['minimum']}")
+        if "maximum" in schema and value > schema["maximum"]:
+            errors.append(f"{where}: {value} is greater than the maximum {schema['maximum']}")
+        if "exclusiveMinimum" in schema and value <= schema["exclusiveMinimum"]:
+            errors.append(f"{where}: {value} must be greater than {schema['exclusiveMinimum']}")
+        if "exclusiveMaximum" in schema and value >= schema["exclusiveMaximum"]:
+            errors.append(f"{where}: {value} must be less than {schema['exclusiveMaximum']}")
+    elif isinstance(value, str):
+        if "minLength" in schema and len(value) < schema["minLength"]:
+            errors.append(f"{where}: shorter than {schema['minLength']} characters")
+        if "maxLength" in schema and len(value) > schema["maxLength"]:
+            errors.append(f"{where}: longer than {schema['maxLength']} characters")
+        pattern = _pattern(schema["pattern"]) if "pattern" in schema else None
+        if pattern is not None and not pattern.search(value):
+            errors.append(f"{where}: {value!r} does not match {schema['pattern']!r}")
+    elif isinstance(value, list):
+        if "minItems" in schema and len(value) < schema["minItems"]:
+            errors.append(f"{where}: fewer than {schema['minItems']} items")
+        if "maxItems" in schema and len(value) > schema["maxItems"]:
+            errors.append(f"{where}: more than {schema['maxItems']} items")
+        if "items" in schema:
+            for i, item in enumerate(value):
+                _check(item, schema["items"], defs, f"{where}[{i}]", errors)
+    elif isinstance(value, dict):
+        for name in schema.get("required", []):
+            if name not in value:
+                errors.append(f"{where}.{name}: required property is missing")
+        if "minProperties" in schema and len(value) < schema["minProperties"]:
+            errors.append(f"{where}: fewer than {schema['minProperties']} properties")
+        if "maxProperties" in schema and len(value) > schema["maxProperties"]:
+            errors.append(f"{where}: more than {schema['maxProperties']} properties")
+        properties = schema.get("properties", {})
+        additional = schema.get("additionalProperties", True)
+        for name, item in value.items():
+            if name in properties:
+                _check(item, properties[name], defs, f"{where}.{name}", errors)
+            elif additional is False:
+                errors.append(f"{where}.{name}: unexpected property")
+            elif isinstance(additional, dict):
+                _check(item, additional, defs, f"{where}.{name}", errors)
+
+    for sub in schema.get("allOf", []):
+        _check(value, sub, defs, where, errors)
+    for key in ("anyOf", "oneOf"):
+        # oneOf is checked like anyOf: overlapping branches are common in real specs
+        if key in schema and not any(_matches(value, sub, defs) for sub in schema[key]):
+            errors.append(f"{where}: does not match any of the allowed schemas")
+
+
+def _matches(value: Any, schema: Dict[str, Any], defs: List[Dict[str, Any]]) -> bool:
+    errors: List[str] = []
+    _check(value, schema, defs, "", errors)
+    return not errors
+
+
+def validate_request(op_id: str, args: Dict[str, Any], body: Any = None) -> None:
+    """Check arguments against the operation's compiled schemas without sending anything.
+
+    String arguments (as given on the command line) are coerced to the schema's type
+    before checking. A missing AUTH_HEADER parameter is fine when API_KEY is set.
+    Raises RequestValidationError listing every problem found.
+    """
+    validation = get_operation(op_id).get("validation")
+    if not validation:
+        return
+    defs = validation["defs"]
+    errors: List[str] = []
+    for name, param in validation["parameters"].items():
+        if name not in args:
+            # The client sends the auth header itself when API_KEY is set
+            injected = API_KEY and param["in"] == "header" and name.lower() == AUTH_HEADER.lower()
+            if param["required"] and not injected:
+                errors.append(f"{name}: required {param['in']} parameter is missing")
+            continue
+        _check(_coerce(args[name], param["schema"], defs), param["schema"], defs, name, errors)
+    if validation["body"] is not None:
+        if body is None:
+            if validation["body"]["required"]:
+                errors.append("body: request body is required")
+        else:
+            _check(body, validation["body"]["schema"], defs, "body", errors)
+    if errors:
+        raise RequestValidationError(op_id, errors)
+
+
+def _operation_request(op_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    """Map an operation ID and its arguments to make_request() keyword arguments."""
+
+    op = get_operation(op_id)
     path = op["path"]
-    
+
     # Substitute path parameters
     for param in op["path_params"]:
         if param in args:
@@ -561,7 +2397,7 @@ def execute_operation(op_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
     headers = {}
     for param in op["header_params"]:
         if param in args:
-            headers[param] = args[param]
+            headers[param] = str(args[param])
     
     # Build body
     body = None
@@ -571,19 +2407,223 @@ def execute_operation(op_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
         else:
             body = args["body"]
     
-    return make_request(
-        method=op["method"],
-        path=path,
-        params=query_params if query_params else None,
-        body=body,
-        headers=headers if headers else None
-    )
+    if VALIDATE:
+        validate_request(op_id, args, body)
+    
+    return {
+        "method": op["method"],
+        "path": path,
+        "params": query_params if query_params else None,
+        "body": body,
+        "headers": headers if headers else None,
+        "cache_ttl": _operation_cache_ttl(op_id, op),
+    }
+
+
+def _operation_cache_ttl(op_id: str, op: Dict[str, Any]) -> Optional[float]:
+    """Configured cache TTL of an operation: by ID, then by tag, then the spec's x-cache-ttl."""
+    if op_id in CACHE_TTLS:
+        return float(CACHE_TTLS[op_id])
+    for tag in op.get("tags", []):
+        if f"tag:{tag}" in CACHE_TTLS:
+            return float(CACHE_TTLS[f"tag:{tag}"])
+    return op.get("cache_ttl")
+
+
+def execute_operation(op_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    """Execute an operation by ID with the given arguments."""
+    return make_request(**_operation_request(op_id, args))
+
+
+async def execute_operation_async(op_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    """Execute an operation by ID on the shared async client."""
+    return await make_request_async(**_operation_request(op_id, args))
+
+
+def call(op_id: str, **params: Any) -> Dict[str, Any]:
+    """Call an operation from Python, reusing the pooled connection across calls."""
+    return execute_operation(op_id, params)
+
+
+async def call_async(op_id: str, **params: Any) -> Dict[str, Any]:
+    """Call an operation from async code, e.g. ``await asyncio.gather(*calls)``."""
+    return await execute_operation_async(op_id, params)
+
+
+def _dig(data: Any, path: Optional[str]) -> Any:
+    """Follow a dotted path such as 'meta.next_cursor' into a response body."""
+    for key in path.split(".") if path else []:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _link_header_next(headers: Any) -> Optional[str]:
+    """The rel="next" URL of an RFC 8288 Link header, if any."""
+    for part in (headers.get("Link") or "").split(","):
+        url, _, rels = part.partition(";")
+        if "next" in rels.replace('"', " ").replace("=", " ").split():
+            return url.strip().strip("<>")
+    return None
+
+
+def _page_records(pagination: Dict[str, Any], body: Any) -> List[Any]:
+    """The records of one page."""
+    if pagination["items"] == "" or isinstance(body, list):
+        return body if isinstance(body, list) else []
+    if pagination["items"] is None:
+        return [body]
+    return _dig(body, pagination["items"]) or []
+
+
+def _next_page_request(
+    pagination: Dict[str, Any],
+    request: Dict[str, Any],
+    body: Any,
+    headers: Any,
+    records: List[Any]
+) -> Optional[Dict[str, Any]]:
+    """make_request() arguments for the page after this one, or None on the last page."""
+    if not records:
+        return None
+    if pagination["has_more"] and not _dig(body, pagination["has_more"]):
+        return None
+    
+    style = pagination["style"]
+    params = dict(request["params"] or {})
+    limit = params.get(pagination["limit_param"]) if pagination["limit_param"] else None
+    following = dict(request)
+    
+    # A Link header, when the API sends one, is authoritative: no rel="next" means last page
+    has_link_header = pagination["link_header"] and headers.get("Link")
+    if style == "link" or has_link_header:
+        url = _dig(body, pagination["next"]) if pagination["next"] else _link_header_next(headers)
+        if not url or not isinstance(url, str):
+            return None
+        current = _prepare_request(request["method"], request["path"], request["params"])["url"]
+        following.update(path=urljoin(current, url), params=None)
+        return following
+    if style == "cursor":
+        if pagination["next"]:
+            cursor = _dig(body, pagination["next"])
+        else:
+            # Stripe style: the cursor is the id of the last record
+            cursor = records[-1].get("id") if isinstance(records[-1], dict) else None
+        if not cursor or str(cursor) == str(params.get(pagination["param"])):
+            return None
+        params[pagination["param"]] = cursor
+    else:
+        if limit is not None and len(records) < int(limit):
+            return None
+        if style == "offset":
+            params[pagination["param"]] = int(params.get(pagination["param"], 0)) + len(records)
+        else:
+            params[pagination["param"]] = int(params.get(pagination["param"], 1)) + 1
+    following["params"] = params
+    return following
+
+
+def iter_pages(op_id: str, args: Dict[str, Any], max_pages: Optional[int] = None) -> Iterator[Tuple[Any, List[Any]]]:
+    """Yield (body, records) for every page of a paginated operation.
+    
+    The next page is requested in a background thread as soon as the current one
+    arrives, so network time overlaps with the caller's processing. At most two pages
+    are held in memory at any time. Iteration stops if a page repeats the previous one
+    (an API ignoring the page parameter would otherwise be paged forever).
+    """
+    pagination = get_operation(op_id).get("pagination")
+    if not pagination:
+        raise ValueError(f"Operation {op_id} has no detected pagination; call it without --all-pages")
+    
+    request = _operation_request(op_id, args)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(_send, _prepare_request(**request))
+        pages = 0
+        previous = None
+        while future is not None:
+            body, headers = future.result()
+            if pages and body == previous:
+                break
+            previous = body
+            pages += 1
+            records = _page_records(pagination, body)
+            request = None if max_pages and pages >= max_pages else _next_page_request(
+                pagination, request, body, headers, records
+            )
+            # Prefetch the next page before handing this one to the caller
+            future = executor.submit(_send, _prepare_request(**request)) if request else None
+            yield body, records
+
+
+def iter_records(op_id: str, args: Dict[str, Any], max_pages: Optional[int] = None) -> Iterator[Any]:
+    """Yield every record of a paginated operation, page by page."""
+    for _, records in iter_pages(op_id, args, max_pages):
+        yield from records
+
+
+async def _run_batch_item(index: int, line: str) -> Dict[str, Any]:
+    """Execute one JSONL batch request; failures are reported, never raised."""
+    request: Dict[str, Any] = {}
+    try:
+        request = json.loads(line)
+        result = await execute_operation_async(request["operation"], request.get("params") or {})
+        return {"id": request.get("id", index), "operation": request["operation"], "ok": True, "result": result}
+    except Exception as e:
+        return {
+            "id": request.get("id", index) if isinstance(request, dict) else index,
+            "operation": request.get("operation") if isinstance(request, dict) else None,
+            "ok": False,
+            "error": f"{type(e).__name__}: {e}",
+        }
+
+
+async def run_batch(stream: IO[str], concurrency: int = CONCURRENCY, out: IO[str] = sys.stdout) -> int:
+    """Run JSONL ``{"operation", "params", "id"?}`` requests from ``stream``.
+    
+    At most ``concurrency`` requests are in flight; each result is written to ``out`` as
+    one JSON line as soon as it completes (so output order may differ from input order).
+    Returns the number of failed requests.
+    """
+    loop = asyncio.get_running_loop()
+    pending: set = set()
+    failures = 0
+    
+    def emit(done) -> int:
+        failed = 0
+        for task in done:
+            result = task.result()
+            failed += not result["ok"]
+            out.write(json.dumps(result) + "\\n")
+        out.flush()
+        return failed
+    
+    try:
+        index = 0
+        while True:
+            # Read lazily so a slow producer on stdin does not block in-flight requests
+            line = await loop.run_in_executor(None, stream.readline)
+            if not line:
+                break
+            if not line.strip():
+                continue
+            pending.add(asyncio.ensure_future(_run_batch_item(index, line)))
+            index += 1
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                failures += emit(done)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            failures += emit(done)
+    finally:
+        await aclose()
+    return failures
 
 
 def list_operations():
     """Print all available operations."""
     print("Available operations:\\n")
-    for op_id, op in OPERATIONS.items():
+    for op_id, op in iter_operations():
         print(f"  {op_id}")
         print(f"    {op['method']} {op['path']}")
         if op['summary']:
@@ -592,10 +2632,25 @@ def list_operations():
 
 
 def main():
+    global CACHE_ENABLED, VALIDATE
     parser = argparse.ArgumentParser(description="API Client")
     parser.add_argument("operation", nargs="?", help="Operation ID to execute")
     parser.add_argument("--list", action="store_true", help="List all operations")
+    parser.add_argument("--search", metavar="QUERY", help="Find operations matching keywords")
+    parser.add_argument("--top", type=int, default=10, help="Number of --search results")
     parser.add_argument("--body", help="JSON body for POST/PUT/PATCH requests")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="Run JSONL requests from FILE ('-' for stdin), streaming JSONL results")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY,
+                        help="Maximum in-flight requests in --batch mode")
+    parser.add_argument("--all-pages", action="store_true",
+                        help="Follow pagination and stream every record as one JSON line")
+    parser.add_argument("--max-pages", type=int, help="Stop --all-pages after this many pages")
+    parser.add_argument("--cache", action=argparse.BooleanOptionalAction, default=None,
+                        help="Enable/disable the GET/HEAD response cache (default: from environment)")
+    parser.add_argument("--validate", action=argparse.BooleanOptionalAction, default=None,
+                        help="Check arguments against the operation's schemas before sending "
+                             "(default: on, unless disabled in the environment)")
     
     # Add a catch-all for dynamic parameters
     args, unknown = parser.parse_known_args()
@@ -604,6 +2659,28 @@ def main():
         list_operations()
         return
     
+    if args.search:
+        for result in search_operations(args.search, args.top):
+            print(f"{result['score']:>7.3f}  {result['operation_id']}")
+            print(f"         {result['method']} {result['path']}")
+            if result["summary"]:
+                print(f"         {result['summary']}")
+        return
+    
+    if args.cache is not None:
+        CACHE_ENABLED = args.cache
+    if args.validate is not None:
+        VALIDATE = args.validate
+    
+    if args.batch:
+        stream = sys.stdin if args.batch == "-" else open(args.batch)
+        with stream:
+            failures = asyncio.run(run_batch(stream, max(1, args.concurrency)))
+        if failures:
+            print(f"Error: {failures} batch request(s) failed", file=sys.stderr)
+            sys.exit(1)
+        return
+    
     if not args.operation:
         parser.print_help()
         return
@@ -627,6 +2704,10 @@ def main():
             i += 1
     
     try:
+        if args.all_pages:
+            for record in iter_records(args.operation, params, args.max_pages):
+                sys.stdout.write(json.dumps(record) + "\\n")
+            return
         result = execute_operation(args.operation, params)
         print(json.dumps(result, indent=2))
     except Exception as e:
@@ -644,12 +2725,93 @@ if __name__ == "__main__":
 def generate_skill(
     source: str,
     output_dir: str,
-    skill_name: Optional[str] = None
+    skill_name: Optional[str] = None,
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+    force: bool = False,
+    split: bool = False,
+    jobs: Optional[int] = None,
+    stream: Optional[bool] = None
 ) -> str:
     """Main function to generate a skill from an OpenAPI spec."""
     
     print(f"📥 Fetching spec from: {source}")
-    spec, fmt = fetch_spec(source)
+    loaded = load_spec(source, cache_dir, stream)
+    try:
+        return build_skill(source, loaded, output_dir, skill_name, force=force, split=split, jobs=jobs)
+    finally:
+        if loaded['raw_temporary']:
+            loaded['raw_path'].unlink(missing_ok=True)
+
+
+def operation_hash(op: Dict[str, Any]) -> str:
+    """Content hash of everything generated from one operation."""
+    client_op = {k: v for k, v in client_operation(op, 0).items() if k != 'index'}
+    payload = json.dumps([_render_view(op), client_op], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def diff_operations(old: Dict[str, str], new: Dict[str, str]) -> Dict[str, List[str]]:
+    """Operation-level changes between two {operation_id: hash} manifests."""
+    return {
+        'added': [op_id for op_id in new if op_id not in old],
+        'changed': [op_id for op_id in new if op_id in old and old[op_id] != new[op_id]],
+        'removed': [op_id for op_id in old if op_id not in new],
+    }
+
+
+def _write_if_changed(
+    skill_dir: Path,
+    rel_path: str,
+    content: str,
+    old_files: Dict[str, str],
+    new_files: Dict[str, str]
+) -> bool:
+    """Write a generated file unless the manifest shows identical content already on disk."""
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+    new_files[rel_path] = digest
+    path = skill_dir / rel_path
+    if old_files.get(rel_path) == digest and path.exists():
+        return False
+    path.write_text(content)
+    return True
+
+
+def build_skill(
+    source: str,
+    loaded: Dict[str, Any],
+    output_dir: str,
+    skill_name: Optional[str] = None,
+    force: bool = False,
+    split: bool = False,
+    jobs: Optional[int] = None
+) -> str:
+    """Write the skill folder for a spec returned by load_spec().
+    
+    The skill's STAMP_FILE doubles as a manifest of per-operation and per-file content
+    hashes. Regeneration diffs against it, re-renders only tags whose operations changed,
+    rewrites only files whose content changed, and reports operation-level changes.
+    The spec's shared resolver and example builder are released afterwards, so
+    long-lived processes (batch workers) do not accumulate them.
+    """
+    try:
+        return _write_skill(source, loaded, output_dir, skill_name, force, split, jobs)
+    finally:
+        release_spec(loaded['spec'])
+
+
+def _write_skill(
+    source: str,
+    loaded: Dict[str, Any],
+    output_dir: str,
+    skill_name: Optional[str],
+    force: bool,
+    split: bool,
+    jobs: Optional[int]
+) -> str:
+    """Body of build_skill()."""
+    spec, fmt = loaded['spec'], loaded['format']
+    # External $refs are resolved relative to the spec's own location
+    resolver = get_resolver(spec, base_uri=source)
     
     version = detect_openapi_version(spec)
     print(f"📋 Detected format: {version} ({fmt})")
@@ -661,6 +2823,30 @@ def generate_skill(
     
     print(f"🏷️  Skill name: {skill_name}")
     
+    skill_dir = Path(output_dir) / skill_name
+    options = {'split': split}
+    stamp = read_skill_stamp(skill_dir)
+    # External $ref documents are part of the input: load them before deciding to skip
+    resolver.prefetch()
+    documents = resolver.document_digests()
+    if (not force
+            and stamp.get('spec_sha256') == loaded['sha256']
+            and stamp.get('documents', {}) == documents
+            and stamp.get('generator_version') == GENERATOR_VERSION
+            and stamp.get('options', {}) == options):
+        print(f"⏭️  Up to date (spec {loaded['sha256'][:12]}, generator {GENERATOR_VERSION}), skipping")
+        return str(skill_dir)
+    bundled = resolver.bundle()
+    if bundled:
+        print(f"📦 Bundled {bundled} external $ref document(s)")
+    
+    old_ops: Optional[Dict[str, str]] = stamp.get('operations')
+    trust_hashes = not force and stamp.get('generator_version') == GENERATOR_VERSION
+    # A different generator may render the same operations differently
+    old_files: Dict[str, str] = stamp.get('files', {}) if trust_hashes else {}
+    old_tags: Dict[str, str] = stamp.get('tags', {}) if trust_hashes else {}
+    new_files: Dict[str, str] = {}
+    
     base_url = extract_base_url(spec, version)
     print(f"🌐 Base URL: {base_url or '(not specified)'}")
     
@@ -670,35 +2856,253 @@ def generate_skill(
     operations = extract_operations(spec, version)
     print(f"⚙️  Found {len(operations)} operations")
     
+    op_hashes = {op['operation_id']: operation_hash(op) for op in operations}
+    if old_ops is not None:
+        changes = diff_operations(old_ops, op_hashes)
+        print(f"🔁 Changes: +{len(changes['added'])} added, ~{len(changes['changed'])} changed, "
+              f"-{len(changes['removed'])} removed")
+        for kind, symbol in (('added', '+'), ('changed', '~'), ('removed', '-')):
+            for op_id in changes[kind][:20]:
+                print(f"   {symbol} {op_id}")
+            if len(changes[kind]) > 20:
+                print(f"   {symbol} ...and {len(changes[kind]) - 20} more")
+    
     # Create skill directory
-    skill_dir = Path(output_dir) / skill_name
     skill_dir.mkdir(parents=True, exist_ok=True)
     (skill_dir / 'scripts').mkdir(exist_ok=True)
     (skill_dir / 'references').mkdir(exist_ok=True)
     
     # Generate SKILL.md
-    skill_md = generate_skill_md(spec, version, operations, skill_name, base_url, security_schemes)
-    (skill_dir / 'SKILL.md').write_text(skill_md)
-    print(f"✅ Created: {skill_dir / 'SKILL.md'}")
+    skill_md = generate_skill_md(spec, version, operations, skill_name, base_url, security_schemes, split=split)
+    if _write_if_changed(skill_dir, 'SKILL.md', skill_md, old_files, new_files):
+        print(f"✅ Created: {skill_dir / 'SKILL.md'}")
+    
+    # One reference file per tag in split mode, re-rendered only when its operations changed
+    ops_dir = skill_dir / 'references' / 'operations'
+    tag_digests: Dict[str, str] = {}
+    if split:
+        ops_dir.mkdir(exist_ok=True)
+        title = spec.get('info', {}).get('title', skill_name)
+        tags_map = group_operations_by_tag(operations)
+        stale_tags = {}
+        for tag, tag_ops in tags_map.items():
+            rel_path = tag_reference_path(tag)
+            payload = json.dumps([title, [op_hashes[op['operation_id']] for op in tag_ops]])
+            tag_digests[tag] = hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+            if old_tags.get(tag) == tag_digests[tag] and rel_path in old_files and (skill_dir / rel_path).exists():
+                new_files[rel_path] = old_files[rel_path]
+            else:
+                stale_tags[tag] = tag_ops
+        for tag, markdown in render_tag_references(title, stale_tags, jobs).items():
+            _write_if_changed(skill_dir, tag_reference_path(tag), markdown, old_files, new_files)
+        print(f"✅ Created: {len(stale_tags)} of {len(tags_map)} tag references in {ops_dir}")
+    if ops_dir.exists():
+        for stale in ops_dir.glob('*.md'):
+            if f"references/operations/{stale.name}" not in new_files:
+                stale.unlink()
+        if not any(ops_dir.iterdir()):
+            ops_dir.rmdir()
     
     # Generate api_client.py
     api_client = generate_api_client(spec, version, operations, skill_name, base_url, security_schemes)
-    (skill_dir / 'scripts' / 'api_client.py').write_text(api_client)
-    os.chmod(skill_dir / 'scripts' / 'api_client.py', 0o755)
-    print(f"✅ Created: {skill_dir / 'scripts' / 'api_client.py'}")
+    if _write_if_changed(skill_dir, 'scripts/api_client.py', api_client, old_files, new_files):
+        os.chmod(skill_dir / 'scripts' / 'api_client.py', 0o755)
+        print(f"✅ Created: {skill_dir / 'scripts' / 'api_client.py'}")
+    
+    # Operation table shards read lazily by api_client.py
+    shards_dir = skill_dir / 'scripts' / 'operations'
+    shards_dir.mkdir(exist_ok=True)
+    shards = generate_operation_shards(operations)
+    rewritten = sum(
+        _write_if_changed(skill_dir, f"scripts/operations/{filename}", content, old_files, new_files)
+        for filename, content in shards.items()
+    )
+    for stale in shards_dir.glob('*.json'):
+        if stale.name not in shards:
+            stale.unlink()
+    print(f"✅ Created: {rewritten} of {len(shards)} operation shards in {shards_dir}")
+    
+    if _write_if_changed(skill_dir, 'scripts/search_index.json', generate_search_index(operations),
+                         old_files, new_files):
+        print(f"✅ Created: {skill_dir / 'scripts' / 'search_index.json'}")
     
-    # Save original spec for reference
+    # Save original spec for reference: a verbatim copy of the fetched bytes, never re-serialized
     spec_filename = f"openapi.{fmt if fmt == 'yaml' else 'json'}"
-    if fmt == 'yaml' and HAS_YAML:
-        (skill_dir / 'references' / spec_filename).write_text(yaml.dump(spec, default_flow_style=False))
-    else:
-        (skill_dir / 'references' / spec_filename).write_text(json.dumps(spec, indent=2))
-    print(f"✅ Created: {skill_dir / 'references' / spec_filename}")
+    spec_path = skill_dir / 'references' / spec_filename
+    if not trust_hashes or stamp.get('spec_sha256') != loaded['sha256'] or not spec_path.exists():
+        shutil.copyfile(loaded['raw_path'], spec_path)
+        print(f"✅ Created: {spec_path}")
+    for other in ('openapi.json', 'openapi.yaml'):
+        if other != spec_filename and (skill_dir / 'references' / other).exists():
+            (skill_dir / 'references' / other).unlink()
+    
+    (skill_dir / STAMP_FILE).write_text(json.dumps({
+        'source': source,
+        'spec_sha256': loaded['sha256'],
+        'documents': documents,
+        'generator_version': GENERATOR_VERSION,
+        'options': options,
+        'operations': op_hashes,
+        'tags': tag_digests,
+        'files': new_files,
+    }, indent=2))
     
     print(f"\n🎉 Skill generated successfully at: {skill_dir}")
     return str(skill_dir)
 
 
+def read_batch_manifest(path: str) -> List[Dict[str, Any]]:
+    """Read a --batch manifest: a JSON/YAML list (or ``{specs: [...]}``) or JSONL of entries.
+    
+    Each entry needs ``source`` and may set ``name`` and ``output``. Relative local sources
+    are resolved against the manifest's directory.
+    """
+    manifest = Path(path)
+    text = manifest.read_text()
+    if manifest.suffix == '.jsonl':
+        entries = [json.loads(line) for line in text.splitlines() if line.strip()]
+    elif manifest.suffix == '.json':
+        entries = json.loads(text)
+    else:
+        if not HAS_YAML:
+            raise ImportError("PyYAML is required for YAML manifests: pip install pyyaml")
+        entries = yaml.load(text, Loader=YAML_LOADER)
+    if isinstance(entries, dict):
+        entries = entries.get('specs', [])
+    
+    for i, entry in enumerate(entries):
+        if isinstance(entry, str):
+            entry = entries[i] = {'source': entry}
+        if not entry.get('source'):
+            raise ValueError(f"Manifest entry {i + 1} has no 'source'")
+        source = entry['source']
+        if not source.startswith(('http://', 'https://')) and not Path(source).is_absolute():
+            entry['source'] = str(manifest.parent / source)
+    return entries
+
+
+def _batch_build_task(task: Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]) -> Dict[str, Any]:
+    """Worker-process half of batch mode: parse one fetched spec and write its skill."""
+    entry, fetched, options = task
+    started, wall_started = time.perf_counter(), time.time()
+    log = io.StringIO()
+    result: Dict[str, Any] = {'status': 'generated', 'operations': None, 'error': None}
+    try:
+        with contextlib.redirect_stdout(log):
+            loaded = load_spec(entry['source'], options['cache_dir'], options['stream'], fetched=fetched)
+            # Tag rendering stays in-process: the batch already uses every core
+            skill_dir = Path(build_skill(entry['source'], loaded, entry.get('output', options['output']),
+                                         entry.get('name'), force=options['force'],
+                                         split=options['split'], jobs=1))
+        result['name'] = skill_dir.name
+        result['operations'] = len(read_skill_stamp(skill_dir).get('operations', {}))
+        # build_skill() leaves the stamp untouched when the skill is already up to date
+        if (skill_dir / STAMP_FILE).stat().st_mtime < wall_started:
+            result['status'] = 'unchanged'
+    except Exception as e:
+        result.update(status='failed', error=f"{type(e).__name__}: {e}")
+    finally:
+        if fetched['raw_temporary']:
+            fetched['raw_path'].unlink(missing_ok=True)
+    result['build_seconds'] = time.perf_counter() - started
+    return result
+
+
+def _fetch_batch_entry(entry: Dict[str, Any], cache_dir: Optional[Path]) -> Tuple[Dict[str, Any], float]:
+    started = time.perf_counter()
+    fetched = fetch_raw_spec(entry['source'], cache_dir)
+    return fetched, time.perf_counter() - started
+
+
+def generate_batch(
+    entries: List[Dict[str, Any]],
+    output_dir: str,
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+    force: bool = False,
+    split: bool = False,
+    jobs: Optional[int] = None,
+    stream: Optional[bool] = None,
+    fetch_concurrency: int = BATCH_FETCH_CONCURRENCY
+) -> List[Dict[str, Any]]:
+    """Generate one skill per manifest entry.
+    
+    Specs are downloaded from a thread pool; each is handed to a process pool as soon as
+    it arrives, so parsing and generation overlap the remaining downloads. Entries sharing
+    a source share one download, and their builds start once the first of them has parsed
+    (and cached) the spec. Returns one result dict per entry, in manifest order.
+    """
+    options = {'output': output_dir, 'cache_dir': cache_dir, 'force': force,
+               'split': split, 'stream': stream}
+    results: List[Dict[str, Any]] = [
+        {'name': entry.get('name') or entry['source'], 'source': entry['source'], 'fetch_seconds': 0.0}
+        for entry in entries
+    ]
+    groups: Dict[str, List[int]] = {}
+    for i, entry in enumerate(entries):
+        groups.setdefault(entry['source'], []).append(i)
+    # Downloads shared by several builds are deleted here, after all of them finished
+    temporary: List[Path] = []
+    jobs = jobs if jobs is not None else (os.cpu_count() or 1)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, fetch_concurrency)) as fetchers, \
+                ProcessPoolExecutor(max_workers=max(1, jobs)) as builders:
+            fetches = {fetchers.submit(_fetch_batch_entry, entries[indices[0]], cache_dir): indices
+                       for indices in groups.values()}
+            builds: Dict[Any, int] = {}
+            followers: Dict[Any, Tuple[List[int], Dict[str, Any]]] = {}
+            pending = set(fetches)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in fetches:
+                        indices = fetches[future]
+                        try:
+                            fetched, seconds = future.result()
+                        except Exception as e:
+                            for i in indices:
+                                results[i].update(status='failed', build_seconds=0.0, operations=None,
+                                                  error=f"{type(e).__name__}: {e}")
+                            continue
+                        for i in indices:
+                            results[i]['fetch_seconds'] = seconds
+                        if fetched['raw_temporary']:
+                            temporary.append(fetched['raw_path'])
+                            fetched = {**fetched, 'raw_temporary': False}
+                        build = builders.submit(_batch_build_task, (entries[indices[0]], fetched, options))
+                        builds[build] = indices[0]
+                        if len(indices) > 1:
+                            followers[build] = (indices[1:], fetched)
+                        pending.add(build)
+                        continue
+                    results[builds[future]].update(future.result())
+                    indices, fetched = followers.pop(future, ([], None))
+                    if indices:
+                        # The spec is parsed and cached now: the other entries reuse that parse
+                        fetched = {**fetched, 'meta': read_cache_meta(entries[indices[0]]['source'], cache_dir)}
+                    for i in indices:
+                        build = builders.submit(_batch_build_task, (entries[i], fetched, options))
+                        builds[build] = i
+                        pending.add(build)
+    finally:
+        for path in temporary:
+            path.unlink(missing_ok=True)
+    return results
+
+
+def print_batch_summary(results: List[Dict[str, Any]], elapsed: float) -> None:
+    """Print a table of per-spec timings, statuses and errors."""
+    width = max([len(r['name']) for r in results] + [4])
+    print(f"\n{'NAME':<{width}}  {'STATUS':<9}  {'FETCH':>7}  {'BUILD':>7}  {'OPS':>5}")
+    for r in results:
+        ops = '-' if r.get('operations') is None else r['operations']
+        print(f"{r['name']:<{width}}  {r['status']:<9}  {r['fetch_seconds']:>6.2f}s  "
+              f"{r['build_seconds']:>6.2f}s  {ops:>5}")
+    failed = [r for r in results if r['status'] == 'failed']
+    for r in failed:
+        print(f"❌ {r['name']} ({r['source']}): {r['error']}", file=sys.stderr)
+    print(f"\n{len(results) - len(failed)} of {len(results)} specs succeeded in {elapsed:.2f}s")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate OpenClaw skill from OpenAPI/Swagger specification",
@@ -708,16 +3112,55 @@ Examples:
   %(prog)s https://petstore3.swagger.io/api/v3/openapi.json
   %(prog)s ./my-api.yaml --name my-api-skill
   %(prog)s https://api.example.com/v1/openapi.json --output ./skills/
+  %(prog)s --batch specs.yaml --output ./skills/
         """
     )
-    parser.add_argument("spec", help="URL or path to OpenAPI/Swagger spec (JSON or YAML)")
+    parser.add_argument("spec", nargs="?", help="URL or path to OpenAPI/Swagger spec (JSON or YAML)")
+    parser.add_argument("--batch", metavar="MANIFEST",
+                        help="Generate every spec listed in a JSON/YAML/JSONL manifest of "
+                             "{source, name, output} entries, in parallel")
     parser.add_argument("--output", "-o", default=".", help="Output directory (default: current)")
     parser.add_argument("--name", "-n", help="Skill name (default: derived from spec title)")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR),
+                        help=f"Parsed-spec cache directory (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--no-cache", action="store_true", help="Always download and parse the spec")
+    parser.add_argument("--force", "-f", action="store_true",
+                        help="Regenerate even if the skill folder is up to date")
+    parser.add_argument("--split", action="store_true",
+                        help="Write one reference file per tag and keep SKILL.md as a compact index")
+    parser.add_argument("--jobs", "-j", type=int,
+                        help="Worker processes for split rendering, or for whole specs "
+                             "with --batch (default: CPU count)")
+    parser.add_argument("--fetch-concurrency", type=int, default=BATCH_FETCH_CONCURRENCY,
+                        help=f"Concurrent downloads with --batch (default: {BATCH_FETCH_CONCURRENCY})")
+    parser.add_argument("--stream", action=argparse.BooleanOptionalAction, default=None,
+                        help="Stream-parse JSON specs with ijson to bound memory "
+                             f"(default: on above {STREAM_THRESHOLD_BYTES // 1_048_576} MB)")
     
     args = parser.parse_args()
+    cache_dir = None if args.no_cache else Path(args.cache_dir)
+    
+    if args.batch:
+        started = time.perf_counter()
+        try:
+            entries = read_batch_manifest(args.batch)
+        except Exception as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        results = generate_batch(entries, args.output, cache_dir=cache_dir, force=args.force,
+                                 split=args.split, jobs=args.jobs, stream=args.stream,
+                                 fetch_concurrency=args.fetch_concurrency)
+        print_batch_summary(results, time.perf_counter() - started)
+        if any(r['status'] == 'failed' for r in results):
+            sys.exit(1)
+        return
+    
+    if not args.spec:
+        parser.error("a spec URL/path or --batch MANIFEST is required")
     
     try:
-        generate_skill(args.spec, args.output, args.name)
+        generate_skill(args.spec, args.output, args.name, cache_dir=cache_dir, force=args.force,
+                       split=args.split, jobs=args.jobs, stream=args.stream)
     except Exception as e:
         print(f"❌ Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -0,0 +1,73 @@
+"""Regression tests for openapi_to_skill.py."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import openapi_to_skill as gen  # noqa: E402
+
+SPEC = {
+    'openapi': '3.0.3',
+    'info': {'title': 'Weather', 'version': '1.0.0'},
+    # Enough operations that concurrent cache writes overlap
+    'paths': {
+        f'/cities/{i}': {
+            'get': {
+                'operationId': f'getCity{i}',
+                'responses': {'200': {'description': 'ok'}},
+            },
+        }
+        for i in range(2000)
+    },
+}
+
+
+def test_batch_duplicate_sources_on_cold_cache(tmp_path):
+    spec_path = tmp_path / 'spec.json'
+    spec_path.write_text(json.dumps(SPEC))
+    entries = [{'source': str(spec_path), 'name': f'weather-{i}'} for i in range(16)]
+
+    results = gen.generate_batch(entries, str(tmp_path / 'out'), cache_dir=tmp_path / 'cache', jobs=8)
+
+    assert [r['status'] for r in results] == ['generated'] * 16, [r.get('error') for r in results]
+    assert not [p.name for p in (tmp_path / 'cache').iterdir() if p.suffix in ('.tmp', '.part')]
+
+
+def _build(spec_path, out_dir, stream):
+    loaded = gen.load_spec(str(spec_path), None, stream)
+    return Path(gen.build_skill(str(spec_path), loaded, str(out_dir), 'cities'))
+
+
+@pytest.mark.skipif(not gen.HAS_IJSON, reason='streaming needs ijson')
+def test_streamed_spec_regenerates_when_external_ref_changes(tmp_path):
+    spec_path = tmp_path / 'spec.json'
+    spec_path.write_text(json.dumps({
+        'openapi': '3.0.3',
+        'info': {'title': 'Cities', 'version': '1.0.0'},
+        'paths': {
+            '/cities': {
+                'post': {
+                    'operationId': 'createCity',
+                    'requestBody': {'content': {'application/json': {'schema': {'$ref': './ext.json#/City'}}}},
+                    'responses': {'200': {'description': 'ok'}},
+                },
+            },
+        },
+    }))
+    ext_path = tmp_path / 'ext.json'
+
+    def write_city(name):
+        ext_path.write_text(json.dumps({'City': {'type': 'object', 'properties': {
+            'name': {'type': 'string', 'example': name}}}}))
+
+    write_city('Paris')
+    skill_dir = _build(spec_path, tmp_path / 'out', stream=True)
+    assert 'Paris' in (skill_dir / 'SKILL.md').read_text()
+
+    write_city('Berlin')
+    _build(spec_path, tmp_path / 'out', stream=True)
+    assert 'Berlin' in (skill_dir / 'SKILL.md').read_text()
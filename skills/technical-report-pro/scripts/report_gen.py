@@ -7,20 +7,65 @@ Generate professional technical reports from templates.
 Usage:
     python report_gen.py --type arch-review --title "System Architecture"
     python report_gen.py --type post-mortem --title "Incident Analysis" --scan research/
+    python report_gen.py --type post-mortem --scan research/ --keywords timeout "connection pool"
+    python report_gen.py --type arch-review --context review.yaml  # Fill placeholders from JSON/YAML
+    python report_gen.py --batch reports.jsonl --output-dir reports/  # Many reports in parallel
+    python report_gen.py --catalog reports/ references/examples/  # Index existing reports
+    python report_gen.py --find "connection pool"  # Search indexed reports
     python report_gen.py --list  # List available templates
 """
 
 import argparse
+import bisect
+import hashlib
+import json
+import math
 import os
+import pickle
 import re
+import sqlite3
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Optional: YAML context files
+try:
+    import yaml
+    HAS_YAML = True
+except ImportError:
+    HAS_YAML = False
 
 # Template directory relative to this script
 SCRIPT_DIR = Path(__file__).parent
 TEMPLATES_DIR = SCRIPT_DIR.parent / "assets" / "templates"
 EXAMPLES_DIR = SCRIPT_DIR.parent / "references" / "examples"
 
+# Persistent scan indexes live here (override with REPORT_GEN_CACHE)
+DEFAULT_INDEX_DIR = Path(os.environ.get(
+    "REPORT_GEN_CACHE", Path.home() / ".cache" / "technical-report-pro"
+))
+
+# Files listed in the scan context (searches always cover every file)
+MAX_LISTED_FILES = 50
+
+PLACEHOLDER_RE = re.compile(r"\{\{([A-Z0-9_]+)\}\}")
+TOKEN_RE = re.compile(r"\w+")
+REPORT_FIELD_RE = re.compile(r"^\*\*(Report ID|Author|Date|Status)\*\*:\s*(.+?)\s*$", re.MULTILINE)
+REPORT_TITLE_RE = re.compile(r"^#\s+([^:\n]+):\s*(.+?)\s*$", re.MULTILINE)
+HEADING_RE = re.compile(r"^#{1,6}\s+(.*)$", re.MULTILINE)
+FENCE_RE = re.compile(r"^(?:```|~~~)", re.MULTILINE)
+
+# Sections longer than this are split at paragraph breaks before ranking
+CHUNK_CHARS = 1200
+# Default character budget for ranked excerpts (roughly 4 characters per token)
+DEFAULT_EXCERPT_BUDGET = 4000
+BM25_K1 = 1.2
+BM25_B = 0.75
+
 TEMPLATE_TYPES = {
     "arch-review": "Architecture Review",
     "post-mortem": "Post-Mortem",
@@ -47,64 +92,731 @@ def load_template(template_type: str) -> str:
     return template_file.read_text()
 
 
-def scan_for_context(scan_path: str, keywords: list = None) -> str:
-    """Scan a directory for relevant context."""
+class CompiledTemplate:
+    """A template split once into static text and placeholder lines.
+    
+    Rendering is a single pass over the segments. A line whose placeholders map to a
+    list is repeated once per item (table rows, bullet points); list items are either
+    plain values or dicts giving every placeholder of that row (one set by another row
+    of the list but not this one renders empty). Placeholders missing from the context
+    are left as ``{{NAME}}``.
+    """
+    
+    def __init__(self, text: str):
+        # Each segment is a str (static text) or the line split by PLACEHOLDER_RE:
+        # literal text at even indices, placeholder names at odd ones
+        self.segments: List[Any] = []
+        self.placeholders: List[str] = []
+        static: List[str] = []
+        for line in text.splitlines(keepends=True):
+            parts = PLACEHOLDER_RE.split(line)
+            if len(parts) == 1:
+                static.append(line)
+                continue
+            if static:
+                self.segments.append("".join(static))
+                static = []
+            self.segments.append(parts)
+            self.placeholders.extend(name for name in parts[1::2] if name not in self.placeholders)
+        if static:
+            self.segments.append("".join(static))
+    
+    @staticmethod
+    def _value(value: Any) -> str:
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        # Block scalars in YAML contexts end with a newline the template already has
+        return str(value).rstrip("\n")
+    
+    def _render_line(self, parts: List[str], context: Dict[str, Any], row: Optional[int], out: List[str]):
+        for i, part in enumerate(parts):
+            if i % 2 == 0:
+                out.append(part)
+                continue
+            value = context.get(part)
+            if value is None:
+                out.append(f"{{{{{part}}}}}")
+                continue
+            if row is not None and isinstance(value, list):
+                value = value[row] if row < len(value) else ""
+                if isinstance(value, dict):
+                    # A dict row that does not set this placeholder
+                    value = ""
+            out.append(self._value(value))
+    
+    def render(self, context: Dict[str, Any]) -> str:
+        """Fill the template from ``context`` (placeholder name -> value or list of values)."""
+        out: List[str] = []
+        for segment in self.segments:
+            if isinstance(segment, str):
+                out.append(segment)
+                continue
+            lists = [context[name] for name in segment[1::2] if isinstance(context.get(name), list)]
+            if not lists:
+                self._render_line(segment, context, None, out)
+                continue
+            # Placeholders set by any dict row render empty in the rows that omit them
+            row_keys = {str(k).upper() for values in lists for item in values
+                        if isinstance(item, dict) for k in item}
+            for row in range(max(len(values) for values in lists)):
+                # Dict rows supply the other placeholders of the line too
+                row_context = {**context, **dict.fromkeys(row_keys, "")}
+                for values in lists:
+                    if row < len(values) and isinstance(values[row], dict):
+                        row_context.update({str(k).upper(): v for k, v in values[row].items()})
+                self._render_line(segment, row_context, row, out)
+        return "".join(out)
+
+
+# template type -> (mtime_ns, compiled template)
+_TEMPLATE_CACHE: Dict[str, Tuple[int, CompiledTemplate]] = {}
+_TEMPLATE_CACHE_LOCK = threading.Lock()
+
+
+def get_compiled_template(template_type: str) -> CompiledTemplate:
+    """Compiled form of a template, recompiled only when the file's mtime changes."""
+    template_file = TEMPLATES_DIR / f"{template_type}.md"
+    try:
+        mtime = template_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Template not found: {template_file}") from None
+    with _TEMPLATE_CACHE_LOCK:
+        cached = _TEMPLATE_CACHE.get(template_type)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, CompiledTemplate(template_file.read_text()))
+            _TEMPLATE_CACHE[template_type] = cached
+        return cached[1]
+
+
+def load_context(source: str) -> Dict[str, Any]:
+    """Read a placeholder context from a JSON or YAML file ('-' for JSON on stdin)."""
+    if source == "-":
+        data = json.load(sys.stdin)
+    else:
+        text = Path(source).read_text()
+        if Path(source).suffix in (".yaml", ".yml"):
+            if not HAS_YAML:
+                raise ImportError("PyYAML is required for YAML context files: pip install pyyaml")
+            data = yaml.safe_load(text)
+        else:
+            data = json.loads(text)
+    if not isinstance(data, dict):
+        raise ValueError(f"Context must be a mapping of placeholder names, got {type(data).__name__}")
+    # Placeholders are upper case; accept any case in context files
+    return {str(key).upper(): value for key, value in data.items()}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens of ``text``."""
+    return TOKEN_RE.findall(text.lower())
+
+
+def chunk_markdown(text: str) -> List[Tuple[int, int, str]]:
+    """Split markdown into (start, end, heading) sections, each at most ~CHUNK_CHARS long."""
+    # Lines starting with '#' inside fenced code blocks are not headings
+    fences = [m.start() for m in FENCE_RE.finditer(text)]
+    starts = [m.start() for m in HEADING_RE.finditer(text) if bisect.bisect_right(fences, m.start()) % 2 == 0]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    chunks = []
+    for start, end in zip(starts, starts[1:] + [len(text)]):
+        heading_match = HEADING_RE.match(text, start)
+        heading = heading_match.group(1).strip() if heading_match else ""
+        # Long sections: cut at the last paragraph break that keeps the piece under the limit
+        while end - start > CHUNK_CHARS:
+            for separator in ("\n\n", "\n", " "):
+                cut = text.rfind(separator, start + 1, start + CHUNK_CHARS)
+                if cut != -1:
+                    break
+            else:
+                cut = start + CHUNK_CHARS
+            chunks.append((start, cut, heading))
+            start = cut
+        if text[start:end].strip():
+            chunks.append((start, end, heading))
+    return chunks
+
+
+class ScanIndex:
+    """Persistent positional inverted index of the markdown files under a directory.
+    
+    Stored as a pickle in ``cache_dir`` and refreshed incrementally: only files whose
+    mtime or size changed are re-read. Words match as prefixes of indexed tokens
+    (``timeout`` finds "Timeouts", ``auth`` finds "authentication"), looked up in the
+    sorted term list; phrases are matched by consecutive token positions, with the
+    last word matched as a prefix. Each file also
+    records its section chunks as token ranges, so passages can be ranked with BM25
+    from the same postings.
+    """
+    
+    VERSION = 2
+    
+    def __init__(self, root: Path, cache_dir: Optional[Path] = DEFAULT_INDEX_DIR):
+        self.root = Path(root).resolve()
+        self.cache_path = None
+        if cache_dir:
+            key = hashlib.sha256(str(self.root).encode("utf-8")).hexdigest()[:16]
+            self.cache_path = Path(cache_dir) / f"scan-{key}.pickle"
+        # relative path -> {"mtime": ns, "size": bytes, "tokens": unique tokens,
+        #                   "chunks": [(first token, char start, char end, heading)]}
+        self.files: Dict[str, dict] = {}
+        # token -> {relative path: [positions]}
+        self.postings: Dict[str, Dict[str, List[int]]] = {}
+        # Sorted postings keys for prefix lookup, rebuilt after the index changes
+        self._terms: Optional[List[str]] = None
+        self._load()
+    
+    def _load(self):
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+        try:
+            with open(self.cache_path, "rb") as f:
+                data = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return
+        if data.get("version") == self.VERSION and data.get("root") == str(self.root):
+            self.files, self.postings = data["files"], data["postings"]
+    
+    def save(self):
+        """Write the index atomically."""
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"version": self.VERSION, "root": str(self.root),
+                         "files": self.files, "postings": self.postings},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.cache_path)
+    
+    def _walk(self) -> Dict[str, os.stat_result]:
+        """Every markdown file under the root (os.scandir, no per-file Path objects)."""
+        found = {}
+        stack = [str(self.root)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".md") and entry.is_file():
+                        found[os.path.relpath(entry.path, self.root)] = entry.stat()
+        return found
+    
+    def _remove(self, rel: str):
+        self._terms = None
+        for token in self.files.pop(rel)["tokens"]:
+            docs = self.postings.get(token)
+            if docs is not None:
+                docs.pop(rel, None)
+                if not docs:
+                    del self.postings[token]
+    
+    def _add(self, rel: str, stat: os.stat_result):
+        try:
+            text = (self.root / rel).read_text(errors="replace")
+        except OSError:
+            return
+        positions: Dict[str, List[int]] = {}
+        chunks = []
+        i = 0
+        for start, end, heading in chunk_markdown(text):
+            chunks.append((i, start, end, heading))
+            for token in tokenize(text[start:end]):
+                positions.setdefault(token, []).append(i)
+                i += 1
+        self._terms = None
+        for token, token_positions in positions.items():
+            self.postings.setdefault(token, {})[rel] = token_positions
+        self.files[rel] = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "tokens": list(positions),
+                           "length": i, "chunks": chunks}
+    
+    def update(self) -> Tuple[int, int]:
+        """Bring the index up to date with the tree. Returns (files re-indexed, files dropped)."""
+        current = self._walk()
+        removed = [rel for rel in self.files if rel not in current]
+        for rel in removed:
+            self._remove(rel)
+        updated = 0
+        for rel, stat in current.items():
+            known = self.files.get(rel)
+            if known and known["mtime"] == stat.st_mtime_ns and known["size"] == stat.st_size:
+                continue
+            if known:
+                self._remove(rel)
+            self._add(rel, stat)
+            updated += 1
+        if updated or removed:
+            self.save()
+        return updated, len(removed)
+    
+    def _prefix_postings(self, prefix: str) -> Dict[str, List[int]]:
+        """Merged postings of every indexed token starting with ``prefix``."""
+        if self._terms is None:
+            self._terms = sorted(self.postings)
+        merged: Dict[str, List[int]] = {}
+        for i in range(bisect.bisect_left(self._terms, prefix), len(self._terms)):
+            term = self._terms[i]
+            if not term.startswith(prefix):
+                break
+            for rel, positions in self.postings[term].items():
+                merged.setdefault(rel, []).extend(positions)
+        return merged
+    
+    def search(self, query: str) -> Dict[str, int]:
+        """Files containing ``query`` (a word or phrase) with their occurrence counts."""
+        tokens = tokenize(query)
+        if not tokens:
+            return {}
+        if len(tokens) == 1:
+            return {rel: len(positions) for rel, positions in self._prefix_postings(tokens[0]).items()}
+        first = self.postings.get(tokens[0], {})
+        rest = [self.postings.get(token, {}) for token in tokens[1:-1]] + [self._prefix_postings(tokens[-1])]
+        matches = {}
+        for rel, positions in first.items():
+            if not all(rel in docs for docs in rest):
+                continue
+            following = [set(docs[rel]) for docs in rest]
+            count = sum(
+                1 for start in positions
+                if all(start + offset + 1 in later for offset, later in enumerate(following))
+            )
+            if count:
+                matches[rel] = count
+        return matches
+    
+    def rank_chunks(self, query: str, top: int = 20) -> List[Tuple[float, str, int]]:
+        """BM25-rank section chunks against ``query``. Returns (score, path, chunk index)."""
+        chunk_count = sum(len(info["chunks"]) for info in self.files.values())
+        if not chunk_count:
+            return []
+        avgdl = sum(info["length"] for info in self.files.values()) / chunk_count or 1.0
+        scores: Dict[Tuple[str, int], float] = {}
+        for token in set(tokenize(query)):
+            # Term frequency per chunk, from token positions
+            freqs: Dict[Tuple[str, int], int] = {}
+            for rel, positions in self._prefix_postings(token).items():
+                firsts = [chunk[0] for chunk in self.files[rel]["chunks"]]
+                for position in positions:
+                    key = (rel, bisect.bisect_right(firsts, position) - 1)
+                    freqs[key] = freqs.get(key, 0) + 1
+            idf = math.log(1 + (chunk_count - len(freqs) + 0.5) / (len(freqs) + 0.5))
+            for (rel, n), tf in freqs.items():
+                chunks = self.files[rel]["chunks"]
+                end = chunks[n + 1][0] if n + 1 < len(chunks) else self.files[rel]["length"]
+                norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * (end - chunks[n][0]) / avgdl)
+                scores[(rel, n)] = scores.get((rel, n), 0.0) + idf * tf * (BM25_K1 + 1) / norm
+        ranked = sorted(scores.items(), key=lambda item: -item[1])[:top]
+        return [(score, rel, n) for (rel, n), score in ranked]
+    
+    def excerpts(self, query: str, budget: int = DEFAULT_EXCERPT_BUDGET) -> List[dict]:
+        """The best-ranked passages for ``query`` whose text fits in ``budget`` characters."""
+        selected = []
+        texts: Dict[str, str] = {}
+        for score, rel, n in self.rank_chunks(query):
+            if budget <= 0:
+                break
+            _, start, end, heading = self.files[rel]["chunks"][n]
+            if rel not in texts:
+                texts[rel] = (self.root / rel).read_text(errors="replace")
+            text = texts[rel][start:end].strip()
+            if len(text) > budget:
+                if selected:
+                    continue
+                text = text[:budget].rstrip() + " …"
+            budget -= len(text)
+            selected.append({"path": rel, "heading": heading, "score": score, "text": text})
+        return selected
+
+
+def scan_for_context(
+    scan_path: str,
+    keywords: list = None,
+    cache_dir: Optional[Path] = DEFAULT_INDEX_DIR,
+    excerpt_budget: int = DEFAULT_EXCERPT_BUDGET,
+    index: Optional[ScanIndex] = None
+) -> str:
+    """Scan a directory for relevant context.
+    
+    Uses a persistent ScanIndex of the tree, so repeated scans only re-read changed
+    files and keyword/phrase lookups never touch file contents. With keywords, the
+    sections that best match them are quoted, up to ``excerpt_budget`` characters.
+    Pass an already updated ``index`` to share one across many reports.
+    """
     path = Path(scan_path)
     if not path.exists():
         return f"(Scan path not found: {scan_path})"
     
+    if index is None:
+        index = ScanIndex(path, cache_dir)
+        index.update()
+    
     context_lines = []
     context_lines.append(f"## Context from {scan_path}\n")
     
     # List files
-    files = list(path.rglob("*.md"))[:20]  # Limit to 20 files
+    files = sorted(index.files)
     if files:
-        context_lines.append("### Files found:")
-        for f in files:
-            context_lines.append(f"- {f.relative_to(path)}")
+        context_lines.append(f"### Files found ({len(files)}):")
+        for rel in files[:MAX_LISTED_FILES]:
+            context_lines.append(f"- {rel}")
+        if len(files) > MAX_LISTED_FILES:
+            context_lines.append(f"- ... and {len(files) - MAX_LISTED_FILES} more")
     
     # If keywords provided, search for them
     if keywords:
         context_lines.append("\n### Keyword matches:")
         for kw in keywords:
-            for f in files:
-                content = f.read_text()
-                if kw.lower() in content.lower():
-                    context_lines.append(f"- '{kw}' found in {f.name}")
+            matches = index.search(kw)
+            if not matches:
+                context_lines.append(f"- '{kw}' not found")
+            for rel, count in sorted(matches.items(), key=lambda item: (-item[1], item[0])):
+                context_lines.append(f"- '{kw}' found in {rel} ({count}×)")
+        
+        excerpts = index.excerpts(" ".join(keywords), excerpt_budget) if excerpt_budget > 0 else []
+        if excerpts:
+            context_lines.append("\n### Relevant excerpts:")
+            for excerpt in excerpts:
+                location = f"{excerpt['path']} › {excerpt['heading']}" if excerpt["heading"] else excerpt["path"]
+                context_lines.append(f"\n**{location}** (score {excerpt['score']:.2f})\n")
+                context_lines.extend(f"> {line}".rstrip() for line in excerpt["text"].splitlines())
     
     return "\n".join(context_lines)
 
 
-def generate_report_id(report_type: str) -> str:
-    """Generate a unique report ID."""
-    prefix_map = {
-        "arch-review": "ARCH",
-        "post-mortem": "PM",
-        "research-summary": "RS",
-        "debug-investigation": "DBG"
+REPORT_ID_PREFIXES = {
+    "arch-review": "ARCH",
+    "post-mortem": "PM",
+    "research-summary": "RS",
+    "debug-investigation": "DBG"
+}
+
+_ISSUED_REPORT_IDS = set()
+_REPORT_ID_LOCK = threading.Lock()
+
+
+def report_filename(report_id: str, report_type: str) -> str:
+    """Default file name of a report."""
+    return f"{report_id}_{report_type}.md"
+
+
+def generate_report_id(report_type: str, output_dir: Optional[Path] = None) -> str:
+    """Generate a unique report ID: ``<PREFIX>-<YYYYMMDD>-<HHMMSS>``.
+    
+    IDs already issued by this process, or whose default file exists in ``output_dir``,
+    get a ``-2``, ``-3``... suffix, so reports made in the same second never collide.
+    """
+    prefix = REPORT_ID_PREFIXES.get(report_type, "RPT")
+    base = f"{prefix}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    with _REPORT_ID_LOCK:
+        report_id, n = base, 1
+        while report_id in _ISSUED_REPORT_IDS or (
+                output_dir is not None and (output_dir / report_filename(report_id, report_type)).exists()):
+            n += 1
+            report_id = f"{base}-{n}"
+        _ISSUED_REPORT_IDS.add(report_id)
+    return report_id
+
+
+def write_atomic(path: Path, text: str):
+    """Write ``text`` to ``path`` via a temporary file, so readers never see a partial report."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def basic_context(title: str, author: str = "Archie", report_id: Optional[str] = None) -> Dict[str, Any]:
+    """Values every report gets unless the context overrides them."""
+    now = datetime.now()
+    context = {
+        "TITLE": title,
+        "DATE": now.strftime("%Y-%m-%d"),
+        "AUTHOR": author,
+        "STATUS": "Draft",
+        "SEQ": now.strftime("%H%M"),
     }
-    prefix = prefix_map.get(report_type, "RPT")
-    date = datetime.now().strftime("%Y%m%d")
-    seq = datetime.now().strftime("%H%M")
-    return f"{prefix}-{date}-{seq}"
-
-
-def fill_basic_placeholders(template: str, title: str, author: str = "Archie") -> str:
-    """Fill in basic placeholders with actual values."""
-    date = datetime.now().strftime("%Y-%m-%d")
-    
-    replacements = {
-        "{{TITLE}}": title,
-        "{{DATE}}": date,
-        "{{AUTHOR}}": author,
-        "{{STATUS}}": "Draft",
-        "{{SEQ}}": datetime.now().strftime("%H%M"),
+    if report_id:
+        context["REPORT_ID"] = report_id
+    return context
+
+
+def fill_basic_placeholders(
+    template: str,
+    title: str,
+    author: str = "Archie",
+    report_type: Optional[str] = None,
+    report_id: Optional[str] = None
+) -> str:
+    """Fill in basic placeholders with actual values (a new report ID unless given)."""
+    report_id = report_id or generate_report_id(report_type or "")
+    return CompiledTemplate(template).render(basic_context(title, author, report_id))
+
+
+def render_report(
+    report_type: str,
+    title: str,
+    author: str = "Archie",
+    context: Optional[Dict[str, Any]] = None,
+    report_id: Optional[str] = None
+) -> str:
+    """Render a report type's cached compiled template from the basic values plus ``context``.
+    
+    ``title``, ``author`` and ``report_id`` take precedence over same-named context keys.
+    """
+    values = {**basic_context(title, author, report_id), **(context or {}), "TITLE": title, "AUTHOR": author}
+    if report_id:
+        values["REPORT_ID"] = report_id
+    return get_compiled_template(report_type).render(values)
+
+
+def read_batch_manifest(path: str) -> List[Dict[str, Any]]:
+    """Read a --batch manifest: JSONL, or a JSON/YAML list, of report entries.
+    
+    Each entry needs ``type`` and may set ``title``, ``author``, ``context`` (a mapping or
+    a JSON/YAML file path), ``scan``, ``keywords`` and ``output``. Relative paths are
+    resolved against the manifest's directory. Entries are not validated here (see
+    batch_entry_error()); unparseable JSONL lines are kept as their raw text.
+    """
+    manifest = Path(path)
+    text = manifest.read_text()
+    if manifest.suffix == ".jsonl":
+        entries = []
+        for line in filter(str.strip, text.splitlines()):
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                entries.append(line)
+    elif manifest.suffix in (".yaml", ".yml"):
+        if not HAS_YAML:
+            raise ImportError("PyYAML is required for YAML manifests: pip install pyyaml")
+        entries = yaml.safe_load(text) or []
+    else:
+        entries = json.loads(text)
+    
+    if not isinstance(entries, list):
+        raise ValueError(f"{path}: expected a list of report entries")
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        for key in ("context", "scan", "output"):
+            value = entry.get(key)
+            if isinstance(value, str) and value != "-" and not Path(value).is_absolute():
+                entry[key] = str(manifest.parent / value)
+    return entries
+
+
+def batch_entry_error(entry: Any) -> Optional[str]:
+    """Why a manifest entry cannot be generated (None if it looks valid)."""
+    if not isinstance(entry, dict):
+        return f"entry must be an object with a 'type', got {str(entry)[:60]!r}"
+    if entry.get("type") not in TEMPLATE_TYPES:
+        return f"'type' must be one of {', '.join(TEMPLATE_TYPES)}, got {entry.get('type')!r}"
+    context = entry.get("context")
+    if context is not None and not isinstance(context, (str, dict)):
+        return "'context' must be a mapping or a file path"
+    return None
+
+
+def _generate_batch_entry(
+    entry: Dict[str, Any],
+    output_dir: Path,
+    indexes: Dict[str, "ScanIndex"],
+    excerpt_budget: int
+) -> Path:
+    """Render and atomically write one manifest entry's report."""
+    report_type = entry["type"]
+    context = entry.get("context") or {}
+    if isinstance(context, str):
+        context = load_context(context)
+    else:
+        context = {str(key).upper(): value for key, value in context.items()}
+    # Entry fields win over the context; the generated report ID always wins
+    context_title, context_author = context.pop("TITLE", None), context.pop("AUTHOR", None)
+    context.pop("REPORT_ID", None)
+    title = entry.get("title") or context_title or f"{TEMPLATE_TYPES[report_type]} Report"
+    author = entry.get("author") or context_author or "Archie"
+    
+    output_path = Path(entry["output"]) if entry.get("output") else None
+    report_id = generate_report_id(report_type, output_dir if output_path is None else None)
+    report = render_report(report_type, title, author, context, report_id)
+    if entry.get("scan"):
+        scan_context = scan_for_context(entry["scan"], entry.get("keywords"), excerpt_budget=excerpt_budget,
+                                        index=indexes.get(entry["scan"]))
+        report += f"\n\n---\n\n{scan_context}"
+    
+    output_path = output_path or output_dir / report_filename(report_id, report_type)
+    write_atomic(output_path, report)
+    return output_path
+
+
+def generate_batch(
+    entries: List[Dict[str, Any]],
+    output_dir: Path,
+    cache_dir: Optional[Path] = DEFAULT_INDEX_DIR,
+    excerpt_budget: int = DEFAULT_EXCERPT_BUDGET,
+    jobs: Optional[int] = None
+) -> List[Tuple[Dict[str, Any], Optional[Path], Optional[str]]]:
+    """Generate every manifest entry's report from a thread pool.
+    
+    Each distinct scan directory is indexed once up front and shared, as is the compiled
+    template cache. Returns (entry, output path, error) per entry, in manifest order;
+    invalid entries fail without stopping the others.
+    """
+    indexes = {}
+    scans = {entry["scan"] for entry in entries if batch_entry_error(entry) is None and entry.get("scan")}
+    for scan in sorted(scans):
+        if Path(scan).exists():
+            indexes[scan] = ScanIndex(Path(scan), cache_dir)
+            indexes[scan].update()
+    
+    def run(entry):
+        error = batch_entry_error(entry)
+        if error:
+            return entry, None, error
+        try:
+            return entry, _generate_batch_entry(entry, output_dir, indexes, excerpt_budget), None
+        except Exception as e:
+            return entry, None, f"{type(e).__name__}: {e}"
+    
+    with ThreadPoolExecutor(max_workers=jobs or min(32, (os.cpu_count() or 1) + 4)) as pool:
+        return list(pool.map(run, entries))
+
+
+def parse_report_header(text: str) -> Optional[Dict[str, str]]:
+    """Report ID, type, title, author, date and status of a report (None if not a report)."""
+    head = text[:4000]
+    fields = {name.lower().replace(" ", "_"): value for name, value in REPORT_FIELD_RE.findall(head)}
+    if "report_id" not in fields:
+        return None
+    title_match = REPORT_TITLE_RE.search(head)
+    label = title_match.group(1).strip() if title_match else ""
+    prefix = fields["report_id"].split("-", 1)[0]
+    report_type = next((key for key, value in REPORT_ID_PREFIXES.items() if value == prefix), None)
+    if report_type is None:
+        report_type = next((key for key, name in TEMPLATE_TYPES.items() if name == label), "")
+    return {
+        "report_id": fields["report_id"],
+        "type": report_type,
+        "title": title_match.group(2) if title_match else "",
+        "author": fields.get("author", ""),
+        "date": fields.get("date", ""),
+        "status": fields.get("status", ""),
     }
+
+
+class ReportCatalog:
+    """SQLite catalog of existing reports with FTS5 full-text search.
+    
+    Directories added with update() are remembered and re-synced incrementally: only
+    markdown files whose mtime or size changed are re-read. Files without a
+    ``**Report ID**`` header are tracked (so they are not re-read) but never returned.
+    """
     
-    for placeholder, value in replacements.items():
-        template = template.replace(placeholder, value)
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS roots (path TEXT PRIMARY KEY);
+        CREATE TABLE IF NOT EXISTS reports (
+            id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL, mtime_ns INTEGER, size INTEGER,
+            report_id TEXT, type TEXT, title TEXT, author TEXT, date TEXT, status TEXT
+        );
+        CREATE VIRTUAL TABLE IF NOT EXISTS reports_fts USING fts5(
+            report_id, type, title, author, status, body, tokenize = 'porter unicode61'
+        );
+    """
     
-    return template
+    def __init__(self, db_path: Path = DEFAULT_INDEX_DIR / "catalog.sqlite3"):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.executescript(self.SCHEMA)
+    
+    def roots(self) -> List[str]:
+        """Directories catalogued so far."""
+        return [row[0] for row in self.conn.execute("SELECT path FROM roots ORDER BY path")]
+    
+    def _delete(self, row_id: int):
+        self.conn.execute("DELETE FROM reports WHERE id = ?", (row_id,))
+        self.conn.execute("DELETE FROM reports_fts WHERE rowid = ?", (row_id,))
+    
+    def update(self, directories: Optional[List[str]] = None) -> Tuple[int, int]:
+        """Sync ``directories`` (default: every known root). Returns (files re-read, files dropped)."""
+        roots = [str(Path(d).resolve()) for d in directories] if directories else self.roots()
+        updated = removed = 0
+        with self.conn:
+            for root in roots:
+                self.conn.execute("INSERT OR IGNORE INTO roots (path) VALUES (?)", (root,))
+                known = {
+                    path: (row_id, mtime, size) for row_id, path, mtime, size in self.conn.execute(
+                        "SELECT id, path, mtime_ns, size FROM reports WHERE path LIKE ? ESCAPE '\\'",
+                        (root.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + os.sep + "%",))
+                }
+                seen = set()
+                for dirpath, _, filenames in os.walk(root):
+                    for name in filenames:
+                        if not name.endswith(".md"):
+                            continue
+                        path = os.path.join(dirpath, name)
+                        try:
+                            stat = os.stat(path)
+                        except OSError:
+                            continue
+                        seen.add(path)
+                        previous = known.get(path)
+                        if previous and previous[1:] == (stat.st_mtime_ns, stat.st_size):
+                            continue
+                        if previous:
+                            self._delete(previous[0])
+                        self._add(path, stat)
+                        updated += 1
+                for path, (row_id, _, _) in known.items():
+                    if path not in seen:
+                        self._delete(row_id)
+                        removed += 1
+        return updated, removed
+    
+    def _add(self, path: str, stat: os.stat_result):
+        try:
+            text = Path(path).read_text(errors="replace")
+        except OSError:
+            return
+        header = parse_report_header(text) or {}
+        cursor = self.conn.execute(
+            "INSERT INTO reports (path, mtime_ns, size, report_id, type, title, author, date, status) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (path, stat.st_mtime_ns, stat.st_size, header.get("report_id"), header.get("type"),
+             header.get("title"), header.get("author"), header.get("date"), header.get("status")))
+        if header:
+            self.conn.execute(
+                "INSERT INTO reports_fts (rowid, report_id, type, title, author, status, body) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (cursor.lastrowid, header["report_id"], header["type"], header["title"],
+                 header["author"], header["status"], text))
+    
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Reports matching an FTS5 query (e.g. ``timeout``, ``"connection pool"``,
+        ``status:resolved AND cache``), best first, with a highlighted snippet."""
+        sql = (
+            "SELECT r.report_id, r.type, r.title, r.author, r.date, r.status, r.path, "
+            "snippet(reports_fts, 5, '**', '**', ' … ', 16) "
+            "FROM reports_fts JOIN reports r ON r.id = reports_fts.rowid "
+            "WHERE reports_fts MATCH ? ORDER BY bm25(reports_fts) LIMIT ?"
+        )
+        try:
+            rows = self.conn.execute(sql, (query, limit)).fetchall()
+        except sqlite3.OperationalError:
+            # Not valid FTS5 syntax: search for the words instead
+            quoted = " ".join(f'"{token}"' for token in tokenize(query))
+            rows = self.conn.execute(sql, (quoted, limit)).fetchall() if quoted else []
+        keys = ("report_id", "type", "title", "author", "date", "status", "path", "snippet")
+        return [dict(zip(keys, row)) for row in rows]
 
 
 def main():
@@ -115,9 +827,29 @@ def main():
     parser.add_argument("--type", "-t", choices=TEMPLATE_TYPES.keys(),
                         help="Report type to generate")
     parser.add_argument("--title", help="Report title")
-    parser.add_argument("--author", default="Archie", help="Author name")
+    parser.add_argument("--author", help="Author name (default: from --context, else Archie)")
+    parser.add_argument("--context", "-c", metavar="FILE",
+                        help="JSON/YAML file of placeholder values; lists repeat table rows ('-' for stdin)")
     parser.add_argument("--scan", help="Directory to scan for context")
+    parser.add_argument("--keywords", "-k", nargs="+", metavar="KEYWORD",
+                        help="Words or quoted phrases to look up in the --scan directory")
+    parser.add_argument("--budget", type=int, default=DEFAULT_EXCERPT_BUDGET,
+                        help="Characters of ranked excerpts to add for --keywords "
+                             f"(default: {DEFAULT_EXCERPT_BUDGET}, 0 to disable)")
+    parser.add_argument("--index-dir", default=str(DEFAULT_INDEX_DIR),
+                        help=f"Scan index cache directory (default: {DEFAULT_INDEX_DIR})")
+    parser.add_argument("--no-index", action="store_true", help="Do not persist the scan index")
     parser.add_argument("--output", "-o", help="Output file path")
+    parser.add_argument("--batch", metavar="MANIFEST",
+                        help="Generate every report in a JSONL/JSON/YAML manifest of "
+                             "{type, title, author, context, scan, keywords, output} entries")
+    parser.add_argument("--output-dir", default=".", help="Directory for --batch reports (default: current)")
+    parser.add_argument("--jobs", "-j", type=int, help="Parallel --batch renders (default: CPU count + 4)")
+    parser.add_argument("--catalog", nargs="*", metavar="DIR",
+                        help="Index reports under DIRs (default: directories indexed before, "
+                             "else references/examples and the current directory)")
+    parser.add_argument("--find", metavar="QUERY", help="Full-text search of catalogued reports")
+    parser.add_argument("--limit", type=int, default=10, help="Maximum --find results")
     parser.add_argument("--list", action="store_true", help="List available templates")
     
     args = parser.parse_args()
@@ -126,34 +858,68 @@ def main():
         list_templates()
         return
     
+    if args.catalog is not None or args.find:
+        catalog = ReportCatalog(Path(args.index_dir) / "catalog.sqlite3")
+        directories = args.catalog or (None if catalog.roots() else [str(EXAMPLES_DIR), "."])
+        updated, removed = catalog.update(directories)
+        if args.catalog is not None:
+            print(f"📚 Catalog: {updated} file(s) indexed, {removed} removed ({', '.join(catalog.roots())})")
+        if args.find:
+            results = catalog.search(args.find, args.limit)
+            if not results:
+                print(f"No reports match '{args.find}'")
+            for r in results:
+                print(f"{r['report_id']}  [{r['type'] or '?'}] {r['title']}")
+                print(f"    {r['date']} · {r['author']} · {r['status']}")
+                print(f"    {r['path']}")
+                print(f"    {' '.join(r['snippet'].split())}")
+        return
+    
+    if args.batch:
+        entries = read_batch_manifest(args.batch)
+        cache_dir = None if args.no_index else Path(args.index_dir)
+        results = generate_batch(entries, Path(args.output_dir), cache_dir, args.budget, args.jobs)
+        failures = 0
+        for i, (entry, output_path, error) in enumerate(results, 1):
+            if error:
+                failures += 1
+                label = f" {entry.get('type')} '{entry.get('title', '')}'" if isinstance(entry, dict) else ""
+                print(f"❌ Entry {i}{label}: {error}", file=sys.stderr)
+            else:
+                print(f"✅ Report generated: {output_path}")
+        if failures:
+            print(f"\n{failures} of {len(results)} reports failed", file=sys.stderr)
+            sys.exit(1)
+        return
+    
     if not args.type:
         parser.print_help()
         print("\nError: --type is required")
         return
     
-    if not args.title:
-        args.title = f"{TEMPLATE_TYPES[args.type]} Report"
+    context = load_context(args.context) if args.context else {}
+    # Flags win over the context; the context's values are only fallbacks
+    context_title, context_author = context.pop("TITLE", None), context.pop("AUTHOR", None)
+    context.pop("REPORT_ID", None)
+    args.title = args.title or context_title or f"{TEMPLATE_TYPES[args.type]} Report"
+    args.author = args.author or context_author or "Archie"
+    
+    output_path = Path(args.output) if args.output else None
+    report_id = generate_report_id(args.type, Path(".") if output_path is None else None)
     
     # Load and fill template
-    template = load_template(args.type)
-    report = fill_basic_placeholders(template, args.title, args.author)
+    report = render_report(args.type, args.title, args.author, context, report_id)
     
     # Add context if scan requested
     if args.scan:
-        context = scan_for_context(args.scan)
+        cache_dir = None if args.no_index else Path(args.index_dir)
+        context = scan_for_context(args.scan, args.keywords, cache_dir, args.budget)
         report += f"\n\n---\n\n{context}"
     
     # Output
-    if args.output:
-        output_path = Path(args.output)
-        output_path.write_text(report)
-        print(f"✅ Report generated: {output_path}")
-    else:
-        # Generate default output path
-        report_id = generate_report_id(args.type)
-        output_file = f"{report_id}_{args.type}.md"
-        Path(output_file).write_text(report)
-        print(f"✅ Report generated: {output_file}")
+    output_path = output_path or Path(report_filename(report_id, args.type))
+    write_atomic(output_path, report)
+    print(f"✅ Report generated: {output_path}")
 
 
 if __name__ == "__main__":
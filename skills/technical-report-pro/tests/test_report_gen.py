@@ -0,0 +1,48 @@
+"""Regression tests for report_gen.py."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "report_gen.py"
+
+
+def run_report_gen(tmp_path, *args):
+    env = {"REPORT_GEN_CACHE": str(tmp_path / "cache"), "PATH": "/usr/bin:/bin"}
+    return subprocess.run([sys.executable, str(SCRIPT), *args], cwd=tmp_path, env=env,
+                          capture_output=True, text=True)
+
+
+def test_title_and_author_flags_override_context(tmp_path):
+    context = tmp_path / "context.json"
+    context.write_text(json.dumps({"title": "From context", "author": "Context Author",
+                                   "report_id": "PM-CONTEXT"}))
+    output = tmp_path / "report.md"
+
+    result = run_report_gen(tmp_path, "--type", "post-mortem", "--title", "Explicit Title",
+                            "--author", "Explicit Author", "--context", str(context), "-o", str(output))
+
+    assert result.returncode == 0, result.stderr
+    report = output.read_text()
+    assert "Explicit Title" in report and "From context" not in report
+    assert "Explicit Author" in report and "Context Author" not in report
+    assert "PM-CONTEXT" not in report
+
+
+def test_batch_entry_fields_override_context(tmp_path):
+    context = tmp_path / "payments.json"
+    context.write_text(json.dumps({"title": "Payments outage", "author": "Context Author",
+                                   "report_id": "PM-CONTEXT"}))
+    manifest = tmp_path / "reports.jsonl"
+    manifest.write_text(json.dumps({"type": "post-mortem", "title": "A", "author": "B",
+                                    "context": "payments.json"}) + "\n")
+
+    result = run_report_gen(tmp_path, "--batch", str(manifest), "--output-dir", str(tmp_path / "out"))
+
+    assert result.returncode == 0, result.stderr
+    [report_path] = (tmp_path / "out").glob("PM-*.md")
+    report = report_path.read_text()
+    assert "# Post-Mortem: A" in report and "Payments outage" not in report
+    assert "Context Author" not in report
+    assert f"**Report ID**: {report_path.name.split('_')[0]}" in report